@@ -47,6 +47,11 @@ Examples:
 
         print(report)
 
+    A large report can be written directly to a file without building the whole string with::
+
+        with open('report.html', 'w') as report_file:
+            report.write_to(report_file)
+
 Attributes:
     Each attribute is made up of what it affects and where that effect takes place.
         i.e. PART_PIECE_WHERE
@@ -93,9 +98,8 @@ Attributes:
 """
 
 # Import standard modules
-from copy import deepcopy
-from enum import Enum
-from typing import cast, Dict, List, Optional, Type
+from itertools import zip_longest
+from typing import cast, Any, Callable, Dict, Iterable, List, Optional, TextIO, Type
 
 LIN_LDR_ATTR = 'lin_ldr'
 LIN_TRM_ATTR = 'lin_trm'
@@ -145,15 +149,22 @@ class SimpleAttribute:
             other (optional): a list of other allowed values.
 
         Attributes:
-            _valid: The value of the other argument with default appended to the list.
+            _valid: A frozenset of the values of the other argument and the default argument.
             _value: The value of the default argument.
         """
         self._value = default
-        self._valid = list(other)
-        self._valid.append(default)
+        self._valid = frozenset((default, *other))
 
     count = property(lambda s: len(s._valid), doc='A read-only property which returns the number of valid attribute values.')
 
+    def clone(self) -> 'SimpleAttribute':
+        """Create a copy of the attribute.
+
+        Returns:
+            A new attribute with the same value and valid values.
+        """
+        return SimpleAttribute(self._value, *self._valid)
+
     @property
     def value(self) -> str:
         """A read-write property which returns and sets the value of the attribute."""
@@ -207,6 +218,14 @@ class MetaAttribute:  # pylint: disable=too-few-public-methods
     simple_attr_name = property(lambda s: s._attr, doc='A read-only property which returns the simple attribute name.')
     values = property(fset=_set_values, doc='A read-only property which returns the values of the attribute as a dictionary.')
 
+    def clone(self) -> 'MetaAttribute':
+        """Create a copy of the attribute.
+
+        Returns:
+            A new attribute with the same simple attribute name and value map.
+        """
+        return MetaAttribute(self._attr, **self._value_map)
+
     def get_value(self, attr: str, /) -> str:
         """Get the value of an attribute.
 
@@ -257,10 +276,44 @@ _ATTRIBUTES = {OUTPUT_ATTR: SimpleAttribute('html', 'text'),
                LST_LDR_ATTR: MetaAttribute(OUTPUT_ATTR, text='', html=''),
                LST_INT_ATTR: MetaAttribute(OUTPUT_ATTR, text=', ', html=', '),
                LST_TRM_ATTR: MetaAttribute(OUTPUT_ATTR, text='', html='')}
+_HTML_VALUES = {attr: meta_attr.get_value('html') for (attr, meta_attr) in _ATTRIBUTES.items() if isinstance(meta_attr, MetaAttribute)}
+_TEXT_VALUES = {attr: meta_attr.get_value('text') for (attr, meta_attr) in _ATTRIBUTES.items() if isinstance(meta_attr, MetaAttribute)}
+_ATTRIBUTE_VALUES = {'html': _HTML_VALUES, 'text': _TEXT_VALUES}
+
+
+class _ReportAttribute:  # pylint: disable=too-few-public-methods
+    """Descriptor to provide read-write access to a report object attribute."""
+
+    def __init__(self, attr: str, doc: str, /):
+        """
+        Args:
+            attr: The attribute.
+            doc: The docstring for the attribute.
+
+        Attributes:
+            _attr: The value of the attr argument.
+            __doc__: The value of the doc argument.
+        """
+        self._attr = attr
+        self.__doc__ = doc
+
+    def __get__(self, obj: Optional['ReportObject'], objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        return obj._get_attribute(self._attr)  # pylint: disable=protected-access
+
+    def __set__(self, obj: 'ReportObject', val: str, /) -> None:
+        obj._set_attribute(self._attr, val)  # pylint: disable=protected-access
 
 
 class ReportObject:  # pylint: disable=too-few-public-methods
-    """Class to create a universal abstract interface for a report object."""
+    """Class to create a universal abstract interface for a report object.
+
+    Attributes:
+        _generation: A counter incremented whenever an attribute or container changes, used to invalidate the resolved attribute caches.
+    """
+    __slots__ = ('_attributes', '_container', '_depth', '_depth_generation', '_resolved', '_resolved_generation')
+    _generation = 0
 
     def __init__(self, container: Optional[Type['ReportObject']] = None, /, **attributes):
         """
@@ -269,14 +322,29 @@ class ReportObject:  # pylint: disable=too-few-public-methods
             **attributes (optional): A dictionary of attributes for the object.
 
         Attributes:
-            container: The value of the container argument.
             _attributes: A dictionary of attributes for this object as initialized by the attr argument.
+            _container: The value of the container argument.
+            _depth: The cached depth of this object.
+            _depth_generation: The value of _generation when the depth was cached.
+            _resolved: A cache of the attribute values resolved for this object.
+            _resolved_generation: The value of _generation when the _resolved cache was filled.
         """
         self._attributes: Dict[str, Attribute] = {}
-        self.container: Optional[Type[ReportObject]] = container
+        self._container: Optional[Type[ReportObject]] = container
+        self._depth = 0
+        self._depth_generation = -1
+        self._resolved: Dict[str, str] = {}
+        self._resolved_generation = ReportObject._generation
         for (attr, val) in attributes.items():
             self._set_attribute(attr, val)
 
+    def __str__(self):
+        if type(self)._write is ReportObject._write:  # pylint: disable=comparison-with-callable
+            return object.__str__(self)
+        parts = []
+        self._write(parts.append)
+        return ''.join(parts)
+
     def _get_attr_ref(self, attr: str, /) -> Attribute:
         """Get a reference to the requested attributes.
 
@@ -306,10 +374,20 @@ class ReportObject:  # pylint: disable=too-few-public-methods
         Returns:
             A value of the requested attribute.
         """
+        if self._resolved_generation != ReportObject._generation:
+            self._resolved = {}
+            self._resolved_generation = ReportObject._generation
+        elif attr in self._resolved:
+            return self._resolved[attr]
         if isinstance((attr_ref := self._get_attr_ref(attr)), MetaAttribute):
-            sub_attr_ref = cast(SimpleAttribute, self._get_attr_ref(attr_ref.simple_attr_name))
-            return attr_ref.get_value(sub_attr_ref.value)
-        return attr_ref.value
+            if attr_ref is _ATTRIBUTES.get(attr):
+                value = _ATTRIBUTE_VALUES[self._get_attribute(OUTPUT_ATTR)][attr]
+            else:
+                value = attr_ref.get_value(self._get_attribute(attr_ref.simple_attr_name))
+        else:
+            value = attr_ref.value
+        self._resolved[attr] = value
+        return value
 
     def _set_attribute(self, attr: str, val: str, /) -> None:
         """Set the value of the requested attributes.
@@ -322,59 +400,99 @@ class ReportObject:  # pylint: disable=too-few-public-methods
             Nothing.
         """
         if attr not in self._attributes:
-            self._attributes[attr] = deepcopy(self._get_attr_ref(attr))
+            self._attributes[attr] = self._get_attr_ref(attr).clone()
             if isinstance(self._attributes[attr], MetaAttribute):
                 cast(MetaAttribute, self._attributes[attr]).values = val
             else:
                 cast(SimpleAttribute, self._attributes[attr]).value = val
+            ReportObject._generation += 1
+
+    def _write(self, write: Callable[[str], Any], /) -> None:
+        """Render the object a piece at a time.
+
+        Containers pass write on to their members so no intermediate strings are built for the children.
+        When a string is needed the pieces are collected into a list and joined once since str.join
+        converts any other iterable into a list before joining.
+        Subclasses which only override __str__ are rendered with it.
+
+        Args:
+            write: The function to call with each rendered piece.
 
-    lin_ldr = property(lambda s: s._get_attribute(LIN_LDR_ATTR), lambda s, v: s._set_attribute(LIN_LDR_ATTR, v), doc='A read-write property for the line leader attribute.')
-    lin_trm = property(lambda s: s._get_attribute(LIN_TRM_ATTR), lambda s, v: s._set_attribute(LIN_TRM_ATTR, v), doc='A read-write property for the line terminator attribute.')
-    lnk_ldr = property(lambda s: s._get_attribute(LNK_LDR_ATTR), lambda s, v: s._set_attribute(LNK_LDR_ATTR, v), doc='A read-write property for the link leader attribute.')
-    lnk_trm = property(lambda s: s._get_attribute(LNK_TRM_ATTR), lambda s, v: s._set_attribute(LNK_TRM_ATTR, v), doc='A read-write property for the link terminator attribute.')
-    lst_int = property(lambda s: s._get_attribute(LST_INT_ATTR), lambda s, v: s._set_attribute(LST_INT_ATTR, v), doc='A read-write property for the list separator attribute.')
-    lst_ldr = property(lambda s: s._get_attribute(LST_LDR_ATTR), lambda s, v: s._set_attribute(LST_LDR_ATTR, v), doc='A read-write property for the list leader attribute.')
-    lst_trm = property(lambda s: s._get_attribute(LST_TRM_ATTR), lambda s, v: s._set_attribute(LST_TRM_ATTR, v), doc='A read-write property for the list terminator attribute.')
-    output = property(lambda s: s._get_attribute(OUTPUT_ATTR), lambda s, v: s._set_attribute(OUTPUT_ATTR, v), doc='A read-write property for the output attribute.')
-    rpt_bdy_ldr = property(lambda s: s._get_attribute(RPT_BDY_LDR_ATTR), lambda s, v: s._set_attribute(RPT_BDY_LDR_ATTR, v), doc='A read-write property for the report body leader attribute.')
-    rpt_bdy_trm = property(lambda s: s._get_attribute(RPT_BDY_TRM_ATTR), lambda s, v: s._set_attribute(RPT_BDY_TRM_ATTR, v), doc='A read-write property for the report body terminator attribute.')
-    rpt_ftr_ldr = property(lambda s: s._get_attribute(RPT_FTR_LDR_ATTR), lambda s, v: s._set_attribute(RPT_FTR_LDR_ATTR, v), doc='A read-write property for the report footer leader attribute.')
-    rpt_ftr_trm = property(lambda s: s._get_attribute(RPT_FTR_TRM_ATTR), lambda s, v: s._set_attribute(RPT_FTR_TRM_ATTR, v), doc='A read-write property for the report footer terminator attribute.')
-    rpt_hdr_ldr = property(lambda s: s._get_attribute(RPT_HDR_LDR_ATTR), lambda s, v: s._set_attribute(RPT_HDR_LDR_ATTR, v), doc='A read-write property for the report header leader attribute.')
-    rpt_hdr_trm = property(lambda s: s._get_attribute(RPT_HDR_TRM_ATTR), lambda s, v: s._set_attribute(RPT_HDR_TRM_ATTR, v), doc='A read-write property for the report header terminator attribute.')
-    rpt_ldr = property(lambda s: s._get_attribute(RPT_LDR_ATTR), lambda s, v: s._set_attribute(RPT_LDR_ATTR, v), doc='A read-write property for the report leader attribute.')
-    rpt_trm = property(lambda s: s._get_attribute(RPT_TRM_ATTR), lambda s, v: s._set_attribute(RPT_TRM_ATTR, v), doc='A read-write property for the report terminator attribute.')
-    sec_bdy_ldr = property(lambda s: s._get_attribute(SEC_BDY_LDR_ATTR), lambda s, v: s._set_attribute(SEC_BDY_LDR_ATTR, v), doc='A read-write property for the section body leader attribute.')
-    sec_bdy_trm = property(lambda s: s._get_attribute(SEC_BDY_TRM_ATTR), lambda s, v: s._set_attribute(SEC_BDY_TRM_ATTR, v), doc='A read-write property for the section body terminator attribute.')
-    sec_ftr_ldr = property(lambda s: s._get_attribute(SEC_FTR_LDR_ATTR), lambda s, v: s._set_attribute(SEC_FTR_LDR_ATTR, v), doc='A read-write property for the section footer leader attribute.')
-    sec_ftr_trm = property(lambda s: s._get_attribute(SEC_FTR_TRM_ATTR), lambda s, v: s._set_attribute(SEC_FTR_TRM_ATTR, v), doc='A read-write property for the section footer terminator attribute.')
-    sec_hdr_ldr = property(lambda s: s._get_attribute(SEC_HDR_LDR_ATTR), lambda s, v: s._set_attribute(SEC_HDR_LDR_ATTR, v), doc='A read-write property for the section header leader attribute.')
-    sec_hdr_trm = property(lambda s: s._get_attribute(SEC_HDR_TRM_ATTR), lambda s, v: s._set_attribute(SEC_HDR_TRM_ATTR, v), doc='A read-write property for the section header terminator attribute.')
-    sec_ldr = property(lambda s: s._get_attribute(SEC_LDR_ATTR), lambda s, v: s._set_attribute(SEC_LDR_ATTR, v), doc='A read-write property for the section leader attribute.')
-    sec_trm = property(lambda s: s._get_attribute(SEC_TRM_ATTR), lambda s, v: s._set_attribute(SEC_TRM_ATTR, v), doc='A read-write property for the section terminator attribute.')
-    tbl_bdy_ldr = property(lambda s: s._get_attribute(TBL_BDY_LDR_ATTR), lambda s, v: s._set_attribute(TBL_BDY_LDR_ATTR, v), doc='A read-write property for the table body leader attribute.')
-    tbl_bdy_trm = property(lambda s: s._get_attribute(TBL_BDY_TRM_ATTR), lambda s, v: s._set_attribute(TBL_BDY_TRM_ATTR, v), doc='A read-write property for the table body terminator attribute.')
-    tbl_cel_ldr = property(lambda s: s._get_attribute(TBL_CEL_LDR_ATTR), lambda s, v: s._set_attribute(TBL_CEL_LDR_ATTR, v), doc='A read-write property for the table cell leader attribute.')
-    tbl_cel_trm = property(lambda s: s._get_attribute(TBL_CEL_TRM_ATTR), lambda s, v: s._set_attribute(TBL_CEL_TRM_ATTR, v), doc='A read-write property for the table cell terminator attribute.')
-    tbl_ftr_ldr = property(lambda s: s._get_attribute(TBL_FTR_LDR_ATTR), lambda s, v: s._set_attribute(TBL_FTR_LDR_ATTR, v), doc='A read-write property for the table footer leader attribute.')
-    tbl_ftr_trm = property(lambda s: s._get_attribute(TBL_FTR_TRM_ATTR), lambda s, v: s._set_attribute(TBL_FTR_TRM_ATTR, v), doc='A read-write property for the table footer terminator attribute.')
-    tbl_hdr_ldr = property(lambda s: s._get_attribute(TBL_HDR_LDR_ATTR), lambda s, v: s._set_attribute(TBL_HDR_LDR_ATTR, v), doc='A read-write property for the table header leader attribute.')
-    tbl_hdr_trm = property(lambda s: s._get_attribute(TBL_HDR_TRM_ATTR), lambda s, v: s._set_attribute(TBL_HDR_TRM_ATTR, v), doc='A read-write property for the table header terminator attribute.')
-    tbl_ldr = property(lambda s: s._get_attribute(TBL_LDR_ATTR), lambda s, v: s._set_attribute(TBL_LDR_ATTR, v), doc='A read-write property for the table leader attribute.')
-    tbl_trm = property(lambda s: s._get_attribute(TBL_TRM_ATTR), lambda s, v: s._set_attribute(TBL_TRM_ATTR, v), doc='A read-write property for the table terminator attribute.')
-    tbl_row_ldr = property(lambda s: s._get_attribute(TBL_ROW_LDR_ATTR), lambda s, v: s._set_attribute(TBL_ROW_LDR_ATTR, v), doc='A read-write property for the table row leader attribute.')
-    tbl_row_trm = property(lambda s: s._get_attribute(TBL_ROW_TRM_ATTR), lambda s, v: s._set_attribute(TBL_ROW_TRM_ATTR, v), doc='A read-write property for the table row terminator attribute.')
+        Returns:
+            Nothing.
+        """
+        write(str(self))
+
+    @property
+    def container(self) -> Optional[Type['ReportObject']]:
+        """A read-write property which returns and sets the container for this object."""
+        return self._container
+
+    @container.setter
+    def container(self, container: Optional[Type['ReportObject']], /) -> None:
+        self._container = container
+        ReportObject._generation += 1
+
+    lin_ldr = _ReportAttribute(LIN_LDR_ATTR, 'A read-write property for the line leader attribute.')
+    lin_trm = _ReportAttribute(LIN_TRM_ATTR, 'A read-write property for the line terminator attribute.')
+    lnk_ldr = _ReportAttribute(LNK_LDR_ATTR, 'A read-write property for the link leader attribute.')
+    lnk_trm = _ReportAttribute(LNK_TRM_ATTR, 'A read-write property for the link terminator attribute.')
+    lst_int = _ReportAttribute(LST_INT_ATTR, 'A read-write property for the list separator attribute.')
+    lst_ldr = _ReportAttribute(LST_LDR_ATTR, 'A read-write property for the list leader attribute.')
+    lst_trm = _ReportAttribute(LST_TRM_ATTR, 'A read-write property for the list terminator attribute.')
+    output = _ReportAttribute(OUTPUT_ATTR, 'A read-write property for the output attribute.')
+    rpt_bdy_ldr = _ReportAttribute(RPT_BDY_LDR_ATTR, 'A read-write property for the report body leader attribute.')
+    rpt_bdy_trm = _ReportAttribute(RPT_BDY_TRM_ATTR, 'A read-write property for the report body terminator attribute.')
+    rpt_ftr_ldr = _ReportAttribute(RPT_FTR_LDR_ATTR, 'A read-write property for the report footer leader attribute.')
+    rpt_ftr_trm = _ReportAttribute(RPT_FTR_TRM_ATTR, 'A read-write property for the report footer terminator attribute.')
+    rpt_hdr_ldr = _ReportAttribute(RPT_HDR_LDR_ATTR, 'A read-write property for the report header leader attribute.')
+    rpt_hdr_trm = _ReportAttribute(RPT_HDR_TRM_ATTR, 'A read-write property for the report header terminator attribute.')
+    rpt_ldr = _ReportAttribute(RPT_LDR_ATTR, 'A read-write property for the report leader attribute.')
+    rpt_trm = _ReportAttribute(RPT_TRM_ATTR, 'A read-write property for the report terminator attribute.')
+    sec_bdy_ldr = _ReportAttribute(SEC_BDY_LDR_ATTR, 'A read-write property for the section body leader attribute.')
+    sec_bdy_trm = _ReportAttribute(SEC_BDY_TRM_ATTR, 'A read-write property for the section body terminator attribute.')
+    sec_ftr_ldr = _ReportAttribute(SEC_FTR_LDR_ATTR, 'A read-write property for the section footer leader attribute.')
+    sec_ftr_trm = _ReportAttribute(SEC_FTR_TRM_ATTR, 'A read-write property for the section footer terminator attribute.')
+    sec_hdr_ldr = _ReportAttribute(SEC_HDR_LDR_ATTR, 'A read-write property for the section header leader attribute.')
+    sec_hdr_trm = _ReportAttribute(SEC_HDR_TRM_ATTR, 'A read-write property for the section header terminator attribute.')
+    sec_ldr = _ReportAttribute(SEC_LDR_ATTR, 'A read-write property for the section leader attribute.')
+    sec_trm = _ReportAttribute(SEC_TRM_ATTR, 'A read-write property for the section terminator attribute.')
+    tbl_bdy_ldr = _ReportAttribute(TBL_BDY_LDR_ATTR, 'A read-write property for the table body leader attribute.')
+    tbl_bdy_trm = _ReportAttribute(TBL_BDY_TRM_ATTR, 'A read-write property for the table body terminator attribute.')
+    tbl_cel_ldr = _ReportAttribute(TBL_CEL_LDR_ATTR, 'A read-write property for the table cell leader attribute.')
+    tbl_cel_trm = _ReportAttribute(TBL_CEL_TRM_ATTR, 'A read-write property for the table cell terminator attribute.')
+    tbl_ftr_ldr = _ReportAttribute(TBL_FTR_LDR_ATTR, 'A read-write property for the table footer leader attribute.')
+    tbl_ftr_trm = _ReportAttribute(TBL_FTR_TRM_ATTR, 'A read-write property for the table footer terminator attribute.')
+    tbl_hdr_ldr = _ReportAttribute(TBL_HDR_LDR_ATTR, 'A read-write property for the table header leader attribute.')
+    tbl_hdr_trm = _ReportAttribute(TBL_HDR_TRM_ATTR, 'A read-write property for the table header terminator attribute.')
+    tbl_ldr = _ReportAttribute(TBL_LDR_ATTR, 'A read-write property for the table leader attribute.')
+    tbl_trm = _ReportAttribute(TBL_TRM_ATTR, 'A read-write property for the table terminator attribute.')
+    tbl_row_ldr = _ReportAttribute(TBL_ROW_LDR_ATTR, 'A read-write property for the table row leader attribute.')
+    tbl_row_trm = _ReportAttribute(TBL_ROW_TRM_ATTR, 'A read-write property for the table row terminator attribute.')
 
     @property
     def depth(self) -> int:
         """A read-only property which returns the report depth of this object."""
-        if self.container:
-            return cast(ReportObject, self.container).depth + 1
-        return 1
+        if self._depth_generation != ReportObject._generation:
+            self._depth = (cast(ReportObject, self.container).depth + 1) if self.container else 1
+            self._depth_generation = ReportObject._generation
+        return self._depth
+
+    def write_to(self, stream: TextIO, /) -> None:
+        """Write the rendered object to a stream.
+
+        Args:
+            stream: The stream to which to write the object.
+
+        Returns:
+            Nothing.
+        """
+        _write_member(self, stream.write)
 
 
 class Section(ReportObject):
     """Class to create a universal abstract interface for a report section."""
+    __slots__ = ('header', 'footer', '_members')
 
     def __init__(self, /, *, header: str = '', footer: str = '', cont: Optional[Type[ReportObject]] = None, **attr):
         """
@@ -394,14 +512,25 @@ class Section(ReportObject):
         self.footer = footer
         self._members: List[Type[ReportObject]] = []
 
-    def __str__(self):
-        the_str = self.sec_ldr
+    def _write(self, write: Callable[[str], Any], /) -> None:
+        write(self.sec_ldr)
         if self.header:
-            the_str += self.sec_hdr_ldr + str(Line(self.header, self)) + self.sec_hdr_trm
-        the_str += self.sec_bdy_ldr + ''.join([str(part) for part in self._members]) + self.sec_bdy_trm
+            write(self.sec_hdr_ldr)
+            write(self.lin_ldr)
+            write(self.header)
+            write(self.lin_trm)
+            write(self.sec_hdr_trm)
+        write(self.sec_bdy_ldr)
+        for part in cast(List[ReportObject], self._members):
+            _write_member(part, write)
+        write(self.sec_bdy_trm)
         if self.footer:
-            the_str += self.sec_ftr_ldr + str(Line(self.footer, self)) + self.sec_ftr_trm
-        return the_str + self.sec_trm
+            write(self.sec_ftr_ldr)
+            write(self.lin_ldr)
+            write(self.footer)
+            write(self.lin_trm)
+            write(self.sec_ftr_trm)
+        write(self.sec_trm)
 
     def add_line(self, line: Type['Line'], /) -> None:
         """Add a line to the section.
@@ -424,7 +553,7 @@ class Section(ReportObject):
             Nothing.
         """
         self._members.append(thing)
-        thing.container = cast(Type[ReportObject], self)
+        cast(ReportObject, thing).container = cast(Type[ReportObject], self)
 
     def add_section(self, section: Type['Section'], /) -> None:
         """Add a sub-section to the section.
@@ -462,19 +591,32 @@ class Section(ReportObject):
 
 class Report(Section):
     """Class to create a universal abstract interface for a report."""
+    __slots__ = ()
 
-    def __str__(self):
-        the_str = self.rpt_ldr
+    def _write(self, write: Callable[[str], Any], /) -> None:
+        write(self.rpt_ldr)
         if self.header:
-            the_str += self.rpt_hdr_ldr + str(Line(self.header, self)) + self.rpt_hdr_trm
-        the_str += self.rpt_bdy_ldr + ''.join([str(part) for part in self._members]) + self.rpt_bdy_trm
+            write(self.rpt_hdr_ldr)
+            write(self.lin_ldr)
+            write(self.header)
+            write(self.lin_trm)
+            write(self.rpt_hdr_trm)
+        write(self.rpt_bdy_ldr)
+        for part in cast(List[ReportObject], self._members):
+            _write_member(part, write)
+        write(self.rpt_bdy_trm)
         if self.footer:
-            the_str += self.rpt_ftr_ldr + str(Line(self.footer, self)) + self.rpt_ftr_trm
-        return the_str + self.rpt_trm
+            write(self.rpt_ftr_ldr)
+            write(self.lin_ldr)
+            write(self.footer)
+            write(self.lin_trm)
+            write(self.rpt_ftr_trm)
+        write(self.rpt_trm)
 
 
 class Cell(ReportObject):
     """Class to create a universal abstract interface for a cell in a table in a report."""
+    __slots__ = ('_data',)
 
     def __init__(self, data: str, cont: Optional[Type[ReportObject]] = None, /, **attr):
         """
@@ -489,15 +631,15 @@ class Cell(ReportObject):
         super().__init__(cont, **attr)
         self._data = data
 
-    def __str__(self):
-        data_str = self._data
-        if isinstance(self._data, (int, list, tuple, Enum, LinkList, Link)) or not self._data:
-            data_str = str(self._data)
-        return self.tbl_cel_ldr + data_str + self.tbl_cel_trm
+    def _write(self, write: Callable[[str], Any], /) -> None:
+        write(self.tbl_cel_ldr)
+        write(_cell_str(self._data))
+        write(self.tbl_cel_trm)
 
 
 class Table(ReportObject):
     """Class to create a universal abstract interface for a report section table."""
+    __slots__ = ('header', 'footer', '_data')
 
     def __init__(self, data: List[List[str]], /, *, header: str = '', footer: str = '', **attr):
         """
@@ -517,42 +659,59 @@ class Table(ReportObject):
         self.footer = footer
         self._data = data
 
-    def __str__(self):
-        col_widths = []
-        if self.output == 'text':
-            for row in self._data:
-                i = 0
-                for col in row:
-                    if (i + 1) > len(col_widths):
-                        col_widths.append(0)
-                    col_widths[i] = max(col_widths[i], len(col))
-                    i += 1
-
-        the_str = self.tbl_ldr
+    def _write(self, write: Callable[[str], Any], /) -> None:
+        write(self.tbl_ldr)
         if self.header:
-            the_str += self.tbl_hdr_ldr + self.header + self.tbl_hdr_trm
-        the_str += self.tbl_bdy_ldr
-        for row in self._data:
-            the_str += self.tbl_row_ldr
-            i = 0
-            for col in row:
-                if self.output == 'text':
-                    col_pad = ' ' * int((col_widths[i] - len(col)) / 2)
-                    col_str = col_pad + col + col_pad
-                    col_str += ' ' * (col_widths[i] - len(col_str))
-                else:
-                    col_str = col
-                the_str += str(Cell(col_str, self))
-                i += 1
-            the_str += self.tbl_row_trm
-        the_str += self.tbl_bdy_trm
+            write(self.tbl_hdr_ldr)
+            write(self.header)
+            write(self.tbl_hdr_trm)
+        write(self.tbl_bdy_ldr)
+        if self.output == 'text':
+            self._write_text_rows(write)
+        else:
+            self._write_rows(write, self._data)
+        write(self.tbl_bdy_trm)
         if self.footer:
-            the_str += self.tbl_ftr_ldr + self.footer + self.tbl_ftr_trm
-        return the_str + self.tbl_trm
+            write(self.tbl_ftr_ldr)
+            write(self.footer)
+            write(self.tbl_ftr_trm)
+        write(self.tbl_trm)
+
+    def _write_rows(self, write: Callable[[str], Any], rows: Iterable[List[str]], /) -> None:
+        """Render the table rows as they are.
+
+        Args:
+            write: The function to call with each rendered row.
+            rows: The rows to render.
+
+        Returns:
+            Nothing.
+        """
+        row_ldr = self.tbl_row_ldr
+        row_trm = self.tbl_row_trm
+        cel_ldr = self.tbl_cel_ldr
+        cel_trm = self.tbl_cel_trm
+        cel_sep = cel_trm + cel_ldr
+        cell_str = _cell_str
+        for row in rows:
+            write((row_ldr + cel_ldr + cel_sep.join([cell_str(col) for col in row]) + cel_trm + row_trm) if row else (row_ldr + row_trm))
+
+    def _write_text_rows(self, write: Callable[[str], Any], /) -> None:
+        """Render the table rows with each cell centered in its column.
+
+        Args:
+            write: The function to call with each rendered row.
+
+        Returns:
+            Nothing.
+        """
+        col_formats = [f'^{max(map(len, col))}' for col in zip_longest(*self._data, fillvalue='')]
+        self._write_rows(write, [list(map(format, row, col_formats)) for row in self._data])
 
 
 class Line(ReportObject):
     """Class to create a universal abstract interface for a report section line."""
+    __slots__ = ('_text',)
 
     def __init__(self, text: str, cont: Optional[Type[ReportObject]] = None, /, **attr):
         """
@@ -567,12 +726,15 @@ class Line(ReportObject):
         super().__init__(cont, **attr)
         self._text = text
 
-    def __str__(self):
-        return self.lin_ldr + self._text + self.lin_trm
+    def _write(self, write: Callable[[str], Any], /) -> None:
+        write(self.lin_ldr)
+        write(self._text)
+        write(self.lin_trm)
 
 
 class Link(Line):
     """Class to create a universal abstract interface for a report hyperlink."""
+    __slots__ = ('_url',)
 
     def __init__(self, text: str, /, url: str = '', cont: Optional[Type[ReportObject]] = None, **attr):
         """
@@ -588,18 +750,15 @@ class Link(Line):
         super().__init__(text, cont, **attr)
         self._url = url
 
-    def __str__(self):
-        try:
-            url = self.lnk_ldr % self._url
-        except TypeError as err:
-            if 'not all arguments converted during string formatting' not in str(err):
-                raise
-            url = self.lnk_ldr
-        return url + self._text + self.lnk_trm
+    def _write(self, write: Callable[[str], Any], /) -> None:
+        write((link_ldr % self._url) if ('%s' in (link_ldr := self.lnk_ldr)) else link_ldr)
+        write(self._text)
+        write(self.lnk_trm)
 
 
 class LinkList(Section):
     """Class to create a universal abstract interface for a list of hyperlinks in a report."""
+    __slots__ = ('_list', '_rendered', '_rendered_generation')
 
     def __init__(self, urls: Dict[str, str], cont: Optional[Type[ReportObject]] = None, /, **attr):
         """
@@ -610,12 +769,56 @@ class LinkList(Section):
 
         Attributes:
             _list: The value of the urls argument converted into links.
+            _rendered: The most recent rendering of the list.
+            _rendered_generation: The value of ReportObject._generation when the list was last rendered.
         """
         super().__init__(cont=cont, **attr)
         self._list = []
-        for key in sorted(urls.keys()):
+        for key in sorted(urls):
             self.register_link(link := Link(key, urls[key]))
             self._list.append(link)
-
-    def __str__(self):
-        return self.lst_int.join([str(item) for item in self._list])
+        self._rendered = ''
+        self._rendered_generation = -1
+
+    def _write(self, write: Callable[[str], Any], /) -> None:
+        if self._rendered_generation != self._generation:
+            parts: List[str] = []
+            parts_append = parts.append
+            separator = self.lst_int
+            for item in self._list:
+                if parts:
+                    parts_append(separator)
+                item._write(parts_append)  # pylint: disable=protected-access
+            self._rendered = ''.join(parts)
+            self._rendered_generation = self._generation
+        write(self._rendered)
+
+
+def _cell_str(data: str, /) -> str:
+    """Convert the data for a table cell to a string.
+
+    Args:
+        data: The cell data.
+
+    Returns:
+        The cell data as a string.
+    """
+    if type(data) is str and data:  # pylint: disable=unidiomatic-typecheck
+        return data
+    return str(data)
+
+
+def _write_member(part: ReportObject, write: Callable[[str], Any], /) -> None:
+    """Render a report object a piece at a time unless its class overrides __str__.
+
+    Args:
+        part: The report object to render.
+        write: The function to call with each rendered piece.
+
+    Returns:
+        Nothing.
+    """
+    if type(part).__str__ is ReportObject.__str__:
+        part._write(write)  # pylint: disable=protected-access
+    else:
+        write(str(part))
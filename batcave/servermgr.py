@@ -1,25 +1,55 @@
 """This module provides utilities for working with servers.
 
 Attributes:
+    _HOST_CACHE (dict): The resolved IP addresses keyed by fully-qualified domain name, each with the time it was resolved.
+    _HOST_CACHE_SIZE (int, default=1024): The maximum number of resolved IP addresses kept.
+    _HOST_CACHE_TTL (int, default=300): The number of seconds a resolved IP address is reused.
+    _LINUX_SERVICE_QUERIES (frozenset): The Linux service commands which only query the service state.
+    _LINUX_SERVICE_TOOLS (dict): The command-line tool which controls each type of Linux service.
+    _LOCAL_DOMAIN (str): The domain of the local host, empty if it has none, read once at import.
+    _LOCAL_FQDN (str): The fully-qualified domain name of the local host, read once at import.
+    _LOCAL_HOSTNAME (str): The short hostname of the local host, read once at import.
+    _OBJECT_CLASSES (dict): The management and OS object classes keyed by item type.
+    _PROCESS_SIGNAL_METHODS (dict): The process method which sends each process signal.
+    _REFRESH_TTL (float, default=0.25): The number of seconds a refreshed management object is reused for attribute reads.
+    _SERVICE_INVALID_TRANSITIONS (frozenset): The (settled state, signal) pairs which cannot be sent to a service.
+    _SERVICE_SETTLED_STATES (dict): The state in which a service settles from each of its states.
+    _SERVICE_SIGNAL_CONTROLS (dict): The service method which sends each service signal with the state the service reaches.
+    _SERVICE_TRANSITION_CONTROLS (dict): The service method which replaces the usual one for each (settled state, signal) pair, empty if nothing needs to be sent.
+    _STATUS_CACHE_TTL (float, default=1): The number of seconds a queried object state is reused.
     _STATUS_CHECK_INTERVAL (int, default=2): This is the default wait in seconds when performing any checks.
+    _SYSTEMD_STATES (dict): The service state for each systemd active state which is not a stopped state.
+    _TASK_SIGNAL_ARGS (dict): The schtasks arguments which send each scheduled task signal.
+    _TASK_SNAPSHOTS (dict): The information for all scheduled tasks keyed by (computer, auth), each with the time it was queried.
+    _UNIQUE_KEYS (dict): The key which identifies each item type whose objects are not identified by Name.
+    _WMI_POOL (local): The per-thread pool of WMI connections keyed by (computer, auth).
+    _WMI_POOL_SIZE (int, default=16): The maximum number of WMI connections kept in the pool for each thread.
 """
 # pylint: disable=invalid-name,too-many-lines
 
 # Import standard modules
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from csv import DictReader
 from enum import Enum
-from os import environ
+from functools import lru_cache
+from ipaddress import ip_address
+from itertools import islice
+from os import environ, fsdecode, readlink, scandir
+from os.path import basename
 from pathlib import Path
 from platform import node
+from shutil import which
 from socket import getfqdn, gethostbyname, gaierror
 from string import Template
-from time import sleep
-from typing import cast, List, Optional, Tuple, Union
-from xml.etree.ElementTree import Element, SubElement, parse as xml_parse
-
-# Import third-party modules
-from psutil import process_iter, NoSuchProcess, Process as _LinuxProcess
+from subprocess import Popen, PIPE
+from tempfile import TemporaryFile
+from threading import local
+from time import monotonic, sleep
+from types import ModuleType
+from typing import cast, Any, Callable, Dict, IO, Iterator, List, Optional, Sequence, Tuple, Type, Union, TYPE_CHECKING
+from xml.sax.saxutils import escape as xml_escape
 
 # Import internal modules
 from .platarch import OsType
@@ -28,10 +58,9 @@ from .sysutil import syscmd, CMDError, ServerAuthType
 from .lang import BatCaveError, BatCaveException, CommandResult, PathName, WIN32
 
 if sys.platform == 'win32':
-    from pywintypes import com_error  # pylint: disable=no-name-in-module,import-error
-    from win32com.client import CDispatch, DispatchEx  # pylint: disable=import-error
-    from wmi import WMI, x_wmi  # pylint: disable=import-error
-    from .iispy import IISInstance
+    if TYPE_CHECKING:
+        from wmi import WMI, x_wmi  # pylint: disable=import-error
+        from .iispy import IISInstance
     _DEFAULT_WMI = True
 else:
     _DEFAULT_WMI = False
@@ -44,7 +73,24 @@ else:
         def __init__(self, *args, **kwargs):
             pass
 
+        def query(self, *args, **kwargs) -> List:  # pylint: disable=unused-argument
+            'Needed to avoid errors on Linux'
+            return []
+
+_HOST_CACHE: Dict[str, Tuple[float, str]] = {}
+_HOST_CACHE_SIZE = 1024
+_HOST_CACHE_TTL = 300
+_LOCAL_FQDN = getfqdn().lower()
+_LOCAL_DOMAIN = _LOCAL_FQDN.partition('.')[2]
+_LOCAL_HOSTNAME = node().split('.')[0].lower()
+_REFRESH_TTL = 0.25
 _STATUS_CHECK_INTERVAL = 2
+_SYSTEMD_STATES = {'active': 'Running', 'activating': 'StartPending', 'deactivating': 'StopPending', 'refreshing': 'Running', 'reloading': 'Running'}
+_STATUS_CACHE_TTL = _STATUS_CHECK_INTERVAL / 2
+_TASK_SNAPSHOTS: Dict[Tuple[str, ServerAuthType], Tuple[float, Dict[str, Dict[str, str]]]] = {}
+_UNIQUE_KEYS = {'Process': 'ProcessId'}
+_WMI_POOL = local()
+_WMI_POOL_SIZE = 16
 
 ProcessSignal = Enum('ProcessSignal', ('stop', 'kill'))
 ServiceSignal = Enum('ServiceSignal', ('disable', 'enable', 'start', 'stop', 'pause', 'resume', 'restart'))
@@ -52,6 +98,30 @@ ServiceState = Enum('ServiceState', ('StartPending', 'ContinuePending', 'Running
 ServiceType = Enum('ServiceType', ('systemd', 'sysv', 'upstart', 'windows'))
 TaskSignal = Enum('TaskSignal', ('enable', 'disable', 'run', 'end'))
 
+_PROCESS_SIGNAL_METHODS = {ProcessSignal.stop: 'Terminate', ProcessSignal.kill: 'Terminate' if WIN32 else 'Kill'}
+_SERVICE_SIGNAL_CONTROLS = {ServiceSignal.enable: ('EnableService', ServiceState.Running),
+                            ServiceSignal.start: ('StartService', ServiceState.Running),
+                            ServiceSignal.resume: ('ResumeService', ServiceState.Running),
+                            ServiceSignal.restart: ('RestartService', ServiceState.Running),
+                            ServiceSignal.disable: ('DisableService', ServiceState.Stopped),
+                            ServiceSignal.stop: ('StopService', ServiceState.Stopped),
+                            ServiceSignal.pause: ('PauseService', ServiceState.Paused)}
+_SERVICE_INVALID_TRANSITIONS = frozenset({(ServiceState.Stopped, ServiceSignal.pause)})
+_SERVICE_SETTLED_STATES = {ServiceState.StartPending: ServiceState.Running, ServiceState.Running: ServiceState.Running, ServiceState.ContinuePending: ServiceState.Running,
+                           ServiceState.StopPending: ServiceState.Stopped, ServiceState.Stopped: ServiceState.Stopped,
+                           ServiceState.PausePending: ServiceState.Paused, ServiceState.Paused: ServiceState.Paused}
+_SERVICE_TRANSITION_CONTROLS = {(ServiceState.Running, ServiceSignal.enable): '',
+                                (ServiceState.Running, ServiceSignal.start): '',
+                                (ServiceState.Running, ServiceSignal.resume): '',
+                                (ServiceState.Stopped, ServiceSignal.disable): '',
+                                (ServiceState.Stopped, ServiceSignal.stop): '',
+                                (ServiceState.Stopped, ServiceSignal.resume): 'StartService',
+                                (ServiceState.Stopped, ServiceSignal.restart): 'StartService',
+                                (ServiceState.Paused, ServiceSignal.start): 'ResumeService'}
+_TASK_SIGNAL_ARGS = {TaskSignal.enable: ('/Change', '/ENABLE'), TaskSignal.disable: ('/Change', '/DISABLE'), TaskSignal.run: ('/Run',), TaskSignal.end: ('/End',)}
+_LINUX_SERVICE_QUERIES = frozenset({'show', 'status'})
+_LINUX_SERVICE_TOOLS = {ServiceType.systemd: 'systemctl', ServiceType.sysv: 'service', ServiceType.upstart: 'initctl'}
+
 type ServerType = Union[str, 'Server']
 type ServerManager = Union[WMI, 'OSManager']
 type WMIObject = Union[bool, WMI]
@@ -94,6 +164,7 @@ class Server:
         _WSAHOST_NOT_FOUND: Error code indicating the host was not found.
         _WMI_SERVICE_CREATE_ERRORS: A dictionary to map WMI errors to errors messages.
     """
+    __slots__ = ('_auth', '_domain', '_fqdn', '_hostname', '_ip', '_is_local', '_os_manager', '_os_type', '_service_type', '_wmi_manager')
     _WMI_SERVICE_CREATE_ERRORS = {1: 'The request is not supported.',
                                   2: 'The user did not have the necessary access.',
                                   3: 'The service cannot be stopped because other services that are running are dependent on it.',
@@ -135,38 +206,24 @@ class Server:
         Attributes:
             _auth: The value of the auth argument.
             _domain: The derived value of the domain argument.
+            _fqdn: The fully-qualified domain name built from the hostname and domain.
             _hostname: The derived value of the hostname argument.
-            _ip: The derived value of the ip argument.
+            _ip: The value of the ip argument, the host name if it is an IP address, empty until first needed otherwise.
+            _is_local: True if the server is the local host.
             _os_manager: The remote management interface for remote servers, None otherwise.
             _os_type: The value of the os_type argument.
+            _service_type: The detected service type of the server, None until first needed.
             _wmi_manager: The WMI object.
-
-        Raises:
-            ServerObjectManagementError.SERVER_NOT_FOUND: If the remote server IP is not found.
         """
-        self._hostname = (hostname if hostname else node().split('.')[0]).lower()
-        try:
-            self._domain = (domain if domain else getfqdn().split('.', 1)[1]).lower()
-        except IndexError:
-            self._domain = ''
+        self._hostname = hostname.lower() if hostname else _LOCAL_HOSTNAME
+        self._domain = domain.lower() if domain else _LOCAL_DOMAIN
+        self._fqdn = f'{self._hostname}.{self._domain}' if self._domain else self._hostname
+        self._is_local = (self._fqdn == _LOCAL_FQDN) or ((self._hostname == _LOCAL_HOSTNAME) and (self._domain == _LOCAL_DOMAIN))
         self._auth = auth
-        self._ip = ip
+        self._ip = ip or _numeric_host(self._hostname)
         self._os_type = os_type
+        self._service_type: Optional[ServiceType] = None
         self._wmi_manager: Optional[WMI] = None
-        if not self._ip:
-            try:
-                self._ip = gethostbyname(self.fqdn)
-            except gaierror as err:
-                server_found = False
-                if err.errno not in (self._WSAHOST_NOT_FOUND, self._WSA_NAME_OR_SERVICE_NOT_KNOWN):
-                    raise
-            else:
-                server_found = True
-            if not server_found:
-                if self.is_local:
-                    self._ip = '127.0.0.1'
-                else:
-                    raise ServerObjectManagementError(ServerObjectManagementError.SERVER_NOT_FOUND, server=self.fqdn)
         self._os_manager = OSManager('' if self.is_local else self.hostname, self._auth)
         if not defer_wmi:
             self._connect_wmi()
@@ -186,14 +243,10 @@ class Server:
         Raises:
             ServerObjectManagementError.REMOTE_CONNECTION_ERROR: If there was an error connecting to the WMI manager.
         """
-        manager_args = {} if self.is_local else {'computer': self.hostname}
-        if isinstance(self._auth, tuple):
-            manager_args['user'] = self._auth[0]
-            manager_args['password'] = self._auth[1]
-
+        wmi_error = _import_wmi()[1]
         try:
-            self._wmi_manager = WMI(**manager_args)
-        except x_wmi as err:
+            self._wmi_manager = _acquire_wmi('' if self.is_local else self.hostname, self._auth)
+        except wmi_error as err:
             raise ServerObjectManagementError(ServerObjectManagementError.REMOTE_CONNECTION_ERROR, server=self.hostname, msg=str(err)) from err
 
     def _get_object_manager(self, item_type: str, wmi: WMIObject, /) -> Optional[ServerManager]:
@@ -211,15 +264,111 @@ class Server:
         """
         if (item_type != 'Service') and (self.os_type != OsType.windows) and not self.is_local:
             raise ServerObjectManagementError(ServerObjectManagementError.REMOTE_NOT_SUPPORTED)
-        if wmi and not self._wmi_manager:
+        if not wmi:
+            return self._os_manager
+        if not self._wmi_manager:
             self._connect_wmi()
-        return self._wmi_manager if wmi else self._os_manager
+        return self._wmi_manager
+
+    def _detect_service_type(self) -> ServiceType:
+        """Determine the service type of the server, probing for the service manager on first use only.
+
+        Returns:
+            The service type.
+        """
+        if self._service_type is None:
+            if self.os_type == OsType.windows:
+                self._service_type = ServiceType.windows
+            elif self.get_path('/sbin/initctl').exists():
+                self._service_type = ServiceType.upstart
+            elif self.get_path('/bin/systemctl').exists():
+                self._service_type = ServiceType.systemd
+            else:
+                self._service_type = ServiceType.sysv
+        return self._service_type
+
+    def _iter_management_objects(self, item_type: str, wmi: WMIObject, /, **filters) -> Iterator['NamedOSObject']:
+        """Generate management objects, wrapping each record only when it is requested.
+
+        Args:
+            item_type: The item type of the objects.
+            wmi: True if this is a Windows platform, False otherwise.
+            **filters (optional, default={}): A dictionary of filters to pass to the manager to filter the objects returned.
+
+        Yields:
+            The management objects.
+        """
+        manager = self._get_object_manager(item_type, wmi)
+        unique_key = _UNIQUE_KEYS.get(item_type, 'Name')
+        object_class = _OBJECT_CLASSES[item_type]
+        manager_type = ManagementObject.OBJECT_PREFIX + item_type
+        extra_keys = {}
+        if (item_type == 'Service') and ('service_type' in filters):  # The service type is also passed to the management object
+            if self.os_type != OsType.windows:
+                extra_keys['service_type'] = filters['service_type']
+            else:
+                del filters['service_type']
+        if wmi:
+            try:
+                records = cast('WMI', manager).query(_wql_select(manager_type, filters))
+            except _import_wmi()[1]:
+                _release_wmi('' if self.is_local else self.hostname, self._auth)
+                self._wmi_manager = None
+                raise
+        else:
+            records = getattr(manager, manager_type)(**filters)
+        for record in records:
+            yield object_class(record, manager, unique_key, getattr(record, unique_key), **extra_keys)
+
+    def _lookup_in_thread(self, lookups: Sequence[Tuple[Callable, str]], /) -> List[Any]:
+        """Run a share of the object lookups from a worker thread of get_status_bundle.
+
+        On Windows the objects found are bound to the COM apartment of the worker thread,
+        so the worker uses its own Server object, only reports which objects exist and uninitializes COM when it is done.
+
+        Args:
+            lookups: A list of (method, name) tuples where method is the unbound Server method to call with name.
+
+        Returns:
+            On Windows whether each object exists, otherwise the result of each lookup.
+        """
+        if sys.platform == 'win32':
+            from pythoncom import CoInitializeEx, CoUninitialize, COINIT_MULTITHREADED  # pylint: disable=no-name-in-module,import-error,import-outside-toplevel
+            CoInitializeEx(COINIT_MULTITHREADED)
+            try:
+                server = Server(self.hostname, self.domain, auth=self._auth, ip=self._ip, os_type=self.os_type)
+                return [method(server, name) is not None for (method, name) in lookups]
+            finally:
+                server = None  # Release the COM objects of this thread before COM is uninitialized
+                if (pool := getattr(_WMI_POOL, 'connections', None)) is not None:
+                    pool.clear()
+                CoUninitialize()
+        return [method(self, name) for (method, name) in lookups]
+
+    def _resolve_ip(self) -> str:
+        """Resolve the IP address of the server.
+
+        Returns:
+            The IP address.
+
+        Raises:
+            ServerObjectManagementError.SERVER_NOT_FOUND: If the remote server IP is not found.
+        """
+        try:
+            self._ip = _resolve_host(self.fqdn)
+        except gaierror as err:
+            if err.errno not in (self._WSAHOST_NOT_FOUND, self._WSA_NAME_OR_SERVICE_NOT_KNOWN):
+                raise
+            if not self.is_local:
+                raise ServerObjectManagementError(ServerObjectManagementError.SERVER_NOT_FOUND, server=self.fqdn) from err
+            self._ip = '127.0.0.1'
+        return self._ip
 
     domain = property(lambda s: s._domain, doc='A read-only property which returns the domain of the server.')
-    fqdn = property(lambda s: f'{s.hostname}.{s.domain}' if s.domain else s.hostname, doc='A read-only property which returns the full-qualified domain name of the server.')
+    fqdn = property(lambda s: s._fqdn, doc='A read-only property which returns the full-qualified domain name of the server.')
     hostname = property(lambda s: s._hostname, doc='A read-only property which returns the hostname of the server.')
-    ip = property(lambda s: s._ip, doc='A read-only property which returns IP for the server.')
-    is_local = property(lambda s: getfqdn().lower() == s.fqdn, doc='A read-only property which returns True if the server is the local host.')
+    ip = property(lambda s: s._ip or s._resolve_ip(), doc='A read-only property which returns IP for the server, resolving it on first use.')
+    is_local = property(lambda s: s._is_local, doc='A read-only property which returns True if the server is the local host.')
     os_type = property(lambda s: s._os_type, doc='A read-only property which returns the OS type of the server.')
 
     def create_management_object(self, item_type: str, unique_id: str, wmi: WMIObject = _DEFAULT_WMI, /, *, error_if_exists: bool = True, **key_args) -> 'ManagementObject':
@@ -239,20 +388,18 @@ class Server:
             ServerObjectManagementError.WMI_ERROR: If there was an error creating the object.
         """
         manager = self._get_object_manager(item_type, wmi)
-        unique_key = 'ProcessId' if (item_type == 'Process') else 'Name'
+        unique_key = _UNIQUE_KEYS.get(item_type, 'Name')
         creation_args = {unique_key: unique_id, 'DisplayName': unique_id}
 
-        created_object = self.get_unique_object(item_type, wmi, **{unique_key: unique_id})
-        result = getattr(manager, ManagementObject.OBJECT_PREFIX + item_type).Create(**creation_args, **key_args)[0] \
-            if error_if_exists or not created_object else False
+        if (not error_if_exists) and (existing_object := self.get_unique_object(item_type, wmi, **{unique_key: unique_id})):
+            return cast(ManagementObject, existing_object)
 
-        if result:
+        if result := getattr(manager, ManagementObject.OBJECT_PREFIX + item_type).Create(**creation_args, **key_args)[0]:
             msg = self._WMI_SERVICE_CREATE_ERRORS[result] if (result in self._WMI_SERVICE_CREATE_ERRORS) else f'Return value: {result}'
             raise ServerObjectManagementError(ServerObjectManagementError.WMI_ERROR, server=self.hostname, msg=msg)
 
-        if not created_object:
-            created_object = self.get_unique_object(item_type, wmi, **{unique_key: unique_id})
-        return globals()[item_type](created_object, manager, unique_key, unique_id)
+        # The WMI Create methods only return a status so the new object has to be looked up.
+        return cast(ManagementObject, self.get_unique_object(item_type, wmi, **{unique_key: unique_id}))
 
     def create_scheduled_task(self, task: str, /, *, exe: str, schedule_type: str, schedule: str, user: str = '', password: str = '',  # pylint: disable=too-many-locals
                               start_in: Optional[PathName] = None, disable: bool = False) -> 'ScheduledTask':
@@ -290,23 +437,19 @@ class Server:
         if isinstance(self._auth, tuple):
             cmd_args += ['/U', self._auth[0], '/P', self._auth[1]]
         _run_task_scheduler(*cmd_args)
-        task_object = self.get_scheduled_task(task)
-
-        if disable:
-            task_object.manage(TaskSignal.disable)
 
         if start_in is None:
             start_in = Path(exe).parent
         if start_in:
-            task_xml = xml_parse(task_file := ScheduledTask.TASK_HOME / task)
-            exec_el = cast(Element, task_xml.find('ns:Actions/ns:Exec', {'ns': ScheduledTask.TASK_NAMESPACE}))
-            SubElement(exec_el, f'{{{ScheduledTask.TASK_NAMESPACE}}}WorkingDirectory').text = str(start_in)
-            task_xml.write(task_file)
+            _add_task_working_directory(task_file := ScheduledTask.TASK_HOME / task, start_in)
             cmd_args = create_base + ['/XML', str(task_file)]
             if password:
                 cmd_args += ['/RU', user, '/RP', password]
             _run_task_scheduler(*cmd_args)
 
+        task_object = self.get_scheduled_task(task)
+        if disable:
+            task_object.manage(TaskSignal.disable, wait=False)  # A task which was just created is not running
         return task_object
 
     def create_service(self, service: str, /, *, exe: str, user: str = '', password: str = '', start: bool = False,
@@ -340,16 +483,7 @@ class Server:
         Returns:
             The list of management objects.
         """
-        manager = self._get_object_manager(item_type, wmi)
-        unique_key = 'ProcessId' if (item_type == 'Process') else 'Name'
-        extra_keys = {}
-        for (key, item_list) in {'service_type': 'Service'}.items():
-            if (item_type in item_list) and (key in filters):
-                if self.os_type != OsType.windows:
-                    extra_keys[key] = filters[key]
-                else:
-                    del filters[key]
-        return [globals()[item_type](r, manager, unique_key, getattr(r, unique_key), **extra_keys) for r in getattr(manager, ManagementObject.OBJECT_PREFIX + item_type)(**filters)]
+        return list(self._iter_management_objects(item_type, wmi, **filters))
 
     def get_object_by_name(self, item_type: str, name: str, wmi: bool = _DEFAULT_WMI, /, **filters) -> Optional['NamedOSObject']:
         """Get a management object by name.
@@ -401,12 +535,7 @@ class Server:
         Returns:
             The scheduled tasks for this server.
         """
-        cmd_args = ['/Query', '/FO', 'CSV']
-        if not self.is_local:
-            cmd_args += ['/S', self.fqdn]
-        if isinstance(self._auth, tuple):
-            cmd_args += ('/U', self._auth[0], '/P', self._auth[1])
-        return [self.get_scheduled_task(t['TaskName']) for t in DictReader(_run_task_scheduler(*cmd_args))]
+        return list(self.iter_scheduled_tasks())
 
     def get_service(self, service: str, /, **key_args) -> 'Service':
         """Get the specified service.
@@ -418,15 +547,7 @@ class Server:
             The specified service.
         """
         if 'service_type' not in key_args:
-            if self.os_type == OsType.windows:
-                service_type = ServiceType.windows
-            elif self.get_path('/sbin/initctl').exists():
-                service_type = ServiceType.upstart
-            elif self.get_path('/bin/systemctl').exists():
-                service_type = ServiceType.systemd
-            else:
-                service_type = ServiceType.sysv
-            key_args['service_type'] = service_type
+            key_args['service_type'] = self._detect_service_type()
         return cast('Service', self.get_object_by_name('Service', service, **key_args))
 
     def get_service_list(self, service_type: Optional[ServiceType] = None, /) -> List['Service']:
@@ -439,16 +560,35 @@ class Server:
             The services for this server.
         """
         if service_type is None:
-            if self.os_type == OsType.windows:
-                service_type = ServiceType.windows
-            elif self.get_path('/sbin/initctl').exists():
-                service_type = ServiceType.upstart
-            elif self.get_path('/bin/systemctl').exists():
-                service_type = ServiceType.systemd
-            else:
-                service_type = ServiceType.sysv
+            service_type = self._detect_service_type()
         return cast(List['Service'], self.get_management_objects('Service', service_type=service_type))
 
+    def get_status_bundle(self, *, services: Sequence[str] = tuple(), tasks: Sequence[str] = tuple()) -> Tuple[List['Service'], List['ScheduledTask']]:
+        """Get several services and scheduled tasks at once by running the lookups concurrently.
+
+        On Windows the worker threads only find which objects exist and the objects found are then fetched on the calling thread
+        so that they use the COM objects of this server.
+
+        Args:
+            services (optional, default=()): The names of the services to get.
+            tasks (optional, default=()): The names of the scheduled tasks to get.
+
+        Returns:
+            A tuple of the list of services and the list of scheduled tasks in the order they were requested.
+        """
+        lookups: List[Tuple[Callable, str]] = [(Server.get_service, s) for s in services] + [(Server.get_scheduled_task, t) for t in tasks]
+        if not lookups:
+            return [], []
+        workers = min(32, len(lookups))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            shares = list(executor.map(self._lookup_in_thread, [lookups[w::workers] for w in range(workers)]))
+        results: List[Any] = [None] * len(lookups)
+        for (worker, share) in enumerate(shares):
+            results[worker::workers] = share
+        if sys.platform == 'win32':
+            results = [(method(self, name) if found else None) for ((method, name), found) in zip(lookups, results)]
+        return results[:len(services)], results[len(services):]
+
     def get_unique_object(self, item_type: str, wmi: WMIObject = _DEFAULT_WMI, /, **filters) -> Optional['NamedOSObject']:
         """Get the requested management object which must be unique.
 
@@ -463,13 +603,24 @@ class Server:
         Raises:
             ServerObjectManagementError.NOT_UNIQUE: If more than one management object was found.
         """
-        match len(results := self.get_management_objects(item_type, wmi, **filters)):
-            case 0:
-                return None
-            case 1:
-                return results[0]
+        results = list(islice(self._iter_management_objects(item_type, wmi, **filters), 2))
+        if not results:
+            return None
+        if len(results) == 1:
+            return results[0]
         raise ServerObjectManagementError(ServerObjectManagementError.NOT_UNIQUE, type=item_type, filters=filters)
 
+    def iter_scheduled_tasks(self) -> Iterator['ScheduledTask']:
+        """Generate the scheduled tasks for this server as schtasks reports them.
+
+        Yields:
+            The scheduled tasks for this server.
+        """
+        manager = self._os_manager
+        for (task, task_info) in _stream_scheduled_tasks(manager.computer, manager.auth):
+            task_object = Win32_ScheduledTask(task, manager.computer, manager.auth, validate=False, task_info=task_info)
+            yield ScheduledTask(cast(ManagementObject, task_object), manager, 'Name', task, fresh=True)
+
     def remove_management_object(self, item_type: str, unique_id: str, wmi: WMIObject = _DEFAULT_WMI, /, *, error_if_not_exists: bool = False) -> None:
         """Remove a management object.
 
@@ -485,7 +636,7 @@ class Server:
         Raises:
             ServerObjectManagementError.WMI_ERROR: If there was an error removing the object.
         """
-        unique_key = 'ProcessId' if (item_type == 'Process') else 'Name'
+        unique_key = _UNIQUE_KEYS.get(item_type, 'Name')
         removal_object = cast('ManagementObject', self.get_unique_object(item_type, wmi, **{unique_key: unique_id}))
         if error_if_not_exists and not removal_object:
             raise ServerObjectManagementError(ServerObjectManagementError.OBJECT_NOT_FOUND, type=item_type)
@@ -532,12 +683,13 @@ class Server:
         return syscmd(command, *cmd_args, remote=(False if self.is_local else self.ip), remote_is_windows=(not self.is_local) and (self.os_type == OsType.windows), **sys_cmd_args)
 
     if sys.platform == 'win32':
-        def get_iis_instance(self) -> IISInstance:
+        def get_iis_instance(self) -> 'IISInstance':
             """Get the IIS instance for this server.
 
             Returns:
                 The IIS instance for this server.
             """
+            from .iispy import IISInstance  # pylint: disable=import-outside-toplevel,redefined-outer-name
             return IISInstance(self.fqdn if not self.is_local else None)
 
         def get_process_connection(self, process: str, /) -> 'COMObject':
@@ -551,6 +703,7 @@ class Server:
 
 class OSManager:
     """Class to make non WMI OS management look like WMI management."""
+    __slots__ = ('auth', 'computer')
 
     def __init__(self, computer: str = '', auth: ServerAuthType = None):
         """
@@ -577,7 +730,7 @@ class OSManager:
             The list of management objects.
         """
         try:
-            return [globals()[object_type](Name, self.computer, self.auth, **key_args)]
+            return [_OBJECT_CLASSES[object_type](Name, self.computer, self.auth, **key_args)]
         except ServerObjectManagementError as err:
             if err.code == ServerObjectManagementError.OBJECT_NOT_FOUND.code:
                 return []
@@ -600,25 +753,24 @@ class OSManager:
         Raises:
             ServerObjectManagementError.BAD_FILTER: If more than one selection option is specified.
         """
-        if len([v for v in (CommandLine, ExecutablePath, Name, ProcessId) if v is not None]) != 1:
+        if sum(v is not None for v in (CommandLine, ExecutablePath, Name, ProcessId)) != 1:
             raise ServerObjectManagementError(ServerObjectManagementError.BAD_FILTER)
 
         if ProcessId:
             try:
                 return [LinuxProcess(ProcessId)]
-            except NoSuchProcess:
+            except _import_psutil().NoSuchProcess:
                 return []
 
-        process_list = [p for p in process_iter(attrs=('pid', 'cmdline', 'exe', 'name'))]  # pylint: disable=unnecessary-comprehension
         if CommandLine:
-            return [LinuxProcess(p.pid) for p in process_list if p.info['cmdline'] == CommandLine]  # type: ignore[attr-defined]
+            return _linux_processes(_match_processes('cmdline', CommandLine))
         if ExecutablePath:
-            return [LinuxProcess(p.pid) for p in process_list if p.info['exe'] == ExecutablePath]  # type: ignore[attr-defined]
+            return _linux_processes(_match_processes('exe', ExecutablePath))
         if Name:
-            return [LinuxProcess(p.pid) for p in process_list if p.info['name'] == Name]  # type: ignore[attr-defined]
+            return _linux_processes(_match_processes('name', Name))
         return []
 
-    def LinuxService(self, Name: str, service_type: ServiceType, /) -> 'LinuxService':
+    def LinuxService(self, Name: str, service_type: ServiceType) -> 'LinuxService':
         """Get the specified Linux service.
 
         Args:
@@ -645,12 +797,13 @@ class OSManager:
 class NamedOSObject:  # pylint: disable=too-few-public-methods
     """Class to allow management of all OS objects using a similar interface."""
 
-    def __init__(self, Name: str, computer: str, auth: ServerAuthType, /):
+    def __init__(self, Name: str, computer: str, auth: ServerAuthType, /, *, validate: bool = True):
         """
         Args:
             Name: The name of the object.
             computer: The remote computer.
             auth: A (username, password) tuple for remote server access.
+            validate (optional, default=True): If True, confirm the object exists. Only pass False when the caller has just read the object from the server.
 
         Attributes:
             auth: The value of the auth argument.
@@ -660,19 +813,25 @@ class NamedOSObject:  # pylint: disable=too-few-public-methods
         self.Name = Name
         self.computer = computer
         self.auth = auth
-        self.validate()  # type: ignore[attr-defined]  # pylint: disable=no-member
+        if validate:
+            self.validate()  # type: ignore[attr-defined]  # pylint: disable=no-member
 
 
 class LinuxService(NamedOSObject):
-    """Class to create a universal abstract interface for a Linux daemon service."""
+    """Class to create a universal abstract interface for a Linux daemon service.
+
+    Attributes:
+        _state: A (timestamp, state) tuple from the last status check, None if there is none.
+    """
+    _state: Optional[Tuple[float, str]] = None
 
-    def __init__(self, Name: str, computer: str, auth: ServerAuthType, service_type: ServiceType, /):
+    def __init__(self, Name: str, computer: str, auth: ServerAuthType, /, service_type: ServiceType):
         """
         Args:
             Name: The name of the object.
             computer: The remote computer.
             auth: A (username, password) tuple for remote server access.
-            service_type: The type of the Linux service
+            service_type: The type of the Linux service.
 
         Attributes:
             type: The value of the service_type argument.
@@ -680,34 +839,60 @@ class LinuxService(NamedOSObject):
         self.type = service_type
         super().__init__(Name, computer, auth)
 
-    def _manage(self, command: str, /) -> CommandResult | CMDError:
+    def _manage(self, command: str, /, *options: str) -> CommandResult | CMDError:
         """Manage the service.
 
         Args:
             command: The management action to perform.
+            *options: Any options to pass to the control tool before the command.
 
         Returns:
             The result of the management command.
         """
-        control_command = ['service', self.Name, command] if (self.type == ServiceType.sysv) \
-            else ['systemctl' if (self.type == ServiceType.systemd) else 'initctl', command, self.Name]
+        if command not in _LINUX_SERVICE_QUERIES:
+            self._state = None
+        control_tool = _LINUX_SERVICE_TOOLS[self.type] if self.computer else _find_tool(_LINUX_SERVICE_TOOLS[self.type])
+        control_command = [control_tool, self.Name, command] if (self.type == ServiceType.sysv) else [control_tool, *options, command, self.Name]
         try:
-            return syscmd(*control_command, use_shell=True, ignore_stderr=True, remote=self.computer, remote_auth=self.auth)
+            return syscmd(*control_command, ignore_stderr=True, remote=self.computer, remote_auth=self.auth, remote_share=bool(self.computer))
         except CMDError as err:
-            if command == 'status':
+            if command in _LINUX_SERVICE_QUERIES:
                 return err
             raise
 
     @property
     def state(self) -> str:
         """A read-only property which returns the state value of the service."""
-        if (result := self._manage('status')) and isinstance(result, list) and ('stop' in result[0]):  # pylint: disable=used-before-assignment
-            return 'Stopped'
-        if not hasattr(result, 'vars'):
-            return 'Running'
-        if (error := cast(CMDError, result)).vars['returncode'] == 3:
-            return 'Stopped'
-        raise error
+        if self._state and ((monotonic() - self._state[0]) <= _STATUS_CACHE_TTL):
+            return self._state[1]
+        if self.type == ServiceType.systemd:
+            state = _SYSTEMD_STATES.get(self._show('ActiveState')['ActiveState'], 'Stopped')
+        elif (result := self._manage('status')) and isinstance(result, list) and ('stop' in result[0]):  # pylint: disable=used-before-assignment
+            state = 'Stopped'
+        elif not hasattr(result, 'vars'):
+            state = 'Running'
+        elif (error := cast(CMDError, result)).vars['returncode'] == 3:
+            state = 'Stopped'
+        else:
+            raise error
+        self._state = (monotonic(), state)
+        return state
+
+    def _show(self, *properties: str) -> Dict[str, str]:
+        """Get properties of a systemd service with a single systemctl show.
+
+        Args:
+            *properties: The names of the properties to get.
+
+        Returns:
+            The property values keyed by property name.
+
+        Raises:
+            CMDError: If the properties could not be read.
+        """
+        if isinstance(result := self._manage('show', *(f'--property={p}' for p in properties)), CMDError):
+            raise result
+        return dict(line.rstrip('\n').partition('=')[::2] for line in cast(List[str], result) if '=' in line)
 
     def DisableService(self) -> None:
         """Disable the service.
@@ -715,6 +900,9 @@ class LinuxService(NamedOSObject):
         Returns:
             Nothing.
         """
+        if self.type == ServiceType.systemd:
+            self._manage('disable', '--now')
+            return
         self.StopService()
         self._manage('disable')
 
@@ -724,6 +912,9 @@ class LinuxService(NamedOSObject):
         Returns:
             Nothing.
         """
+        if self.type == ServiceType.systemd:
+            self._manage('enable', '--now')
+            return
         self._manage('enable')
         self.StartService()
 
@@ -760,16 +951,26 @@ class LinuxService(NamedOSObject):
         Raises:
             ServerObjectManagementError.OBJECT_NOT_FOUND: If the service is not found.
         """
+        if self.type == ServiceType.systemd:
+            if (unit := self._show('ActiveState', 'LoadState')).get('LoadState') == 'not-found':
+                raise ServerObjectManagementError(ServerObjectManagementError.OBJECT_NOT_FOUND, type=type(self).__name__)
+            self._state = (monotonic(), _SYSTEMD_STATES.get(unit['ActiveState'], 'Stopped'))
+            return
         try:
             self.state
         except CMDError as err:
-            if not err.vars['returncode'] == (4 if (self.type == ServiceType.systemd) else 1):
+            if not err.vars['returncode'] == 1:
                 raise
             raise ServerObjectManagementError(ServerObjectManagementError.OBJECT_NOT_FOUND, type=type(self).__name__) from err
 
 
 class LinuxProcess:
-    """Class to create a universal abstract interface for a Linux process."""
+    """Class to create a universal abstract interface for a Linux process.
+
+    Attributes:
+        _proc_info: The (command line, executable path, name) tuple read for the process, None if it has not been read.
+    """
+    _proc_info: Optional[Tuple[List[str], str, str]] = None
 
     def __init__(self, ProcessId: int, /):
         """
@@ -781,11 +982,42 @@ class LinuxProcess:
             ProcessId: The value of the ProcessId argument.
         """
         self.ProcessId = ProcessId
-        self.process_obj = _LinuxProcess(self.ProcessId)
+        self.process_obj = _import_psutil().Process(self.ProcessId)
+
+    CommandLine = property(lambda s: s._get_proc_info()[0], doc='A read-only property which returns the command line for the process.')
+    ExecutablePath = property(lambda s: s._get_proc_info()[1], doc='A read-only property which returns the executable path for the process.')
+    Name = property(lambda s: s._get_proc_info()[2], doc='A read-only property which returns the name of the process.')
 
-    CommandLine = property(lambda s: s.process_obj.cmdline(), doc='A read-only property which returns the command line for the process.')
-    ExecutablePath = property(lambda s: s.process_obj.exe(), doc='A read-only property which returns the executable path for the process.')
-    Name = property(lambda s: s.process_obj.name(), doc='A read-only property which returns the name of the process.')
+    def _get_proc_info(self) -> Tuple[List[str], str, str]:
+        """Read the command line, executable path and name of the process together the first time any of them is needed.
+
+        Returns:
+            The (command line, executable path, name) tuple for the process.
+
+        Raises:
+            NoSuchProcess: If the process has exited.
+        """
+        if self._proc_info is None:
+            if not sys.platform.startswith('linux'):
+                with self.process_obj.oneshot():
+                    self._proc_info = (self.process_obj.cmdline(), self.process_obj.exe(), self.process_obj.name())
+                return self._proc_info
+            proc_dir = f'/proc/{self.ProcessId}'
+            try:
+                if (exe := _read_proc_attr(proc_dir, 'exe')) is None:
+                    exe = self.process_obj.exe()  # Let psutil report the access error
+                self._proc_info = (_read_proc_attr(proc_dir, 'cmdline'), exe, _read_proc_attr(proc_dir, 'name'))
+            except (FileNotFoundError, ProcessLookupError) as err:
+                raise _import_psutil().NoSuchProcess(self.ProcessId) from err
+        return self._proc_info
+
+    def refresh(self) -> None:
+        """Discard the command line, executable path and name read for the process.
+
+        Returns:
+            Nothing.
+        """
+        self._proc_info = None
 
     def Kill(self) -> None:
         """Kill the process.
@@ -809,13 +1041,36 @@ class LinuxScheduledTask:  # pylint: disable=too-few-public-methods
 
 
 class Win32_ScheduledTask(NamedOSObject):
-    """Class to abstract a Windows Scheduled Task since they are not available using WMI."""
+    """Class to abstract a Windows Scheduled Task since they are not available using WMI.
+
+    Attributes:
+        _task_info: A (timestamp, task information) tuple from the last query of the task, None if there is none.
+    """
+    _task_info: Optional[Tuple[float, Dict[str, str]]] = None
+
+    def __init__(self, Name: str, computer: str, auth: ServerAuthType, /, *, validate: bool = True, task_info: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            Name: The name of the object.
+            computer: The remote computer.
+            auth: A (username, password) tuple for remote server access.
+            validate (optional, default=True): If True, confirm the object exists. Only pass False when the caller has just read the object from the server.
+            task_info (optional, default=None): The task information if the caller has just queried it from the server.
+        """
+        if task_info:
+            self._task_info = (monotonic(), task_info)
+        super().__init__(Name, computer, auth, validate=validate)
 
     def __getattr__(self, attr: str):
         if attr == 'state':
             attr = 'scheduled_task_state'
         attr = attr.title().replace('_', ' ')
-        task_info = [line for line in DictReader(self._run_task_scheduler('/Query', '/V', '/FO', 'CSV'))][0]  # pylint: disable=unnecessary-comprehension
+        if not (self._task_info and ((monotonic() - self._task_info[0]) <= _STATUS_CACHE_TTL)):
+            snapshot = _scheduled_task_snapshot(self.computer, self.auth)
+            if not (task_info := snapshot.get(self.Name) or snapshot.get('\\' + self.Name)):
+                task_info = self._query_task_info()
+            self._task_info = (monotonic(), task_info)
+        task_info = self._task_info[1]
         if attr not in task_info:
             raise AttributeError(f"'{type(self)}' object has no attribute '{attr}'")
         return task_info[attr]
@@ -837,6 +1092,23 @@ class Win32_ScheduledTask(NamedOSObject):
             args += ('/U', self.auth[0], '/P', self.auth[1])
         return _run_task_scheduler(*args, **sys_cmd_args)
 
+    def _is_not_running(self) -> bool:
+        """Query the task status, bypassing the cached task information, and determine if the task is not running.
+
+        Returns:
+            True if the task is not running, False otherwise.
+        """
+        self._task_info = (monotonic(), self._query_task_info())
+        return self.status.lower() != 'running'
+
+    def _query_task_info(self) -> Dict[str, str]:
+        """Query the information for only this task.
+
+        Returns:
+            The task information.
+        """
+        return next(DictReader(self._run_task_scheduler('/Query', '/V', '/FO', 'CSV')))
+
     def manage(self, signal: TaskSignal, /, *, wait: bool = True) -> None:
         """Manage the scheduled task.
 
@@ -850,22 +1122,14 @@ class Win32_ScheduledTask(NamedOSObject):
         Raises:
             ServerObjectManagementError.BAD_OBJECT_SIGNAL: If the signal is unknown.
         """
-        control_args: Tuple = tuple()
-        match signal:
-            case TaskSignal.enable:
-                control_args = ('/Change', '/ENABLE')
-            case TaskSignal.disable:
-                control_args = ('/Change', '/DISABLE')
-            case TaskSignal.run:
-                control_args = ('/Run',)
-            case TaskSignal.end:
-                control_args = ('/End',)
-            case _:
-                raise ServerObjectManagementError(ServerObjectManagementError.BAD_OBJECT_SIGNAL, signal=signal.name)
-
+        if not (control_args := _TASK_SIGNAL_ARGS.get(signal)):
+            raise ServerObjectManagementError(ServerObjectManagementError.BAD_OBJECT_SIGNAL, signal=signal.name)
         self._run_task_scheduler(*control_args)
-        while wait and (self.status.lower() == 'running'):
-            sleep(_STATUS_CHECK_INTERVAL)
+        _TASK_SNAPSHOTS.pop((self.computer, self.auth), None)
+        if wait:
+            _wait_for(self._is_not_running)
+        else:
+            self._task_info = None
 
     def remove(self) -> CommandResult:
         """Remove the scheduled task.
@@ -873,7 +1137,10 @@ class Win32_ScheduledTask(NamedOSObject):
         Returns:
             The result of the remove command.
         """
-        return self._run_task_scheduler('/Delete', '/F')
+        result = self._run_task_scheduler('/Delete', '/F')
+        _TASK_SNAPSHOTS.pop((self.computer, self.auth), None)
+        self._task_info = None
+        return result
 
     def validate(self) -> None:
         """Determine if the scheduled task exists.
@@ -897,16 +1164,19 @@ class ManagementObject:
 
     Attributes:
         OBJECT_PREFIX: The prefix to use to correctly translate to a NamesOSObject type.
+        _refreshed: The time of the last refresh of the object.
     """
     OBJECT_PREFIX = 'Win32_' if WIN32 else 'Linux'
+    _refreshed = 0.0
 
-    def __init__(self, object_ref: 'ManagementObject', manager: OSManager, key: str, value: str, /, **key_values):
+    def __init__(self, object_ref: 'ManagementObject', manager: OSManager, key: str, value: str, /, *, fresh: bool = False, **key_values):
         """
         Args:
             object_ref: A reference to the management object.
             manager: A reference to the manager of the object.
             key: The unique key used to identify the object to the manager.
             value: The unique value used to identify the object to the manager.
+            fresh (optional, default=False): If True, object_ref has just been read from the manager so it is not refreshed for the first attribute reads.
             key_values (optional): A additional dictionary of key/value pairs to apply when referencing the object in the manager.
 
         Attributes:
@@ -923,6 +1193,8 @@ class ManagementObject:
         self.key = key
         self.value = value
         self.key_values = key_values
+        if fresh:
+            self._refreshed = monotonic()
 
     def __enter__(self):
         return self
@@ -932,9 +1204,18 @@ class ManagementObject:
         return False
 
     def __getattr__(self, attr: str):
-        self.refresh()
+        if (monotonic() - self._refreshed) > _REFRESH_TTL:
+            self.refresh()
         return getattr(self.object_ref, attr)
 
+    def invalidate(self) -> None:
+        """Mark the object as stale so that the next attribute read refreshes it.
+
+        Returns:
+            Nothing.
+        """
+        self._refreshed = 0.0
+
     def refresh(self) -> None:
         """Refresh the state of the object.
 
@@ -948,6 +1229,7 @@ class ManagementObject:
             if len(results := cast(List[ManagementObject], getattr(self.manager, self.type)(**{self.key: self.value}, **self.key_values))) > 1:
                 raise ServerObjectManagementError(ServerObjectManagementError.NOT_UNIQUE, type=self.type, key=self.key, val=self.value)
             self.object_ref = results[0] if results else None
+            self._refreshed = monotonic()
 
 
 class Service(ManagementObject):
@@ -955,7 +1237,7 @@ class Service(ManagementObject):
 
     def __getattr__(self, attr: str):
         if attr == 'state':
-            return self.ServiceState[super().__getattr__(attr).replace(' ', '')]
+            return ServiceState[super().__getattr__(attr).replace(' ', '')]
         return super().__getattr__(attr)
 
     def manage(self, signal: ServiceSignal, /, *, wait: bool = True, ignore_state: bool = False, timeout: int = False) -> None:  # pylint: disable=too-many-branches,too-many-statements
@@ -976,75 +1258,45 @@ class Service(ManagementObject):
             ServerObjectManagementError.BAD_TRANSITION: If ignore_state is False and the requested action is not valid for the current state.
             ServerObjectManagementError.STATUS_CHECK_TIMEOUT: If wait is True and timeout is not False and the object has not reached the required state.
         """
-        match signal:
-            case self.ServiceSignal.enable | self.ServiceSignal.start | self.ServiceSignal.resume | self.ServiceSignal.restart:
-                match signal:
-                    case self.ServiceSignal.enable:
-                        control_method = 'EnableService'
-                    case self.ServiceSignal.start:
-                        control_method = 'StartService'
-                    case self.ServiceSignal.resume:
-                        control_method = 'ResumeService'
-                    case self.ServiceSignal.restart:
-                        control_method = 'RestartService'
-                final_state = self.ServiceState.Running
-            case self.ServiceSignal.disable | self.ServiceSignal.stop:
-                control_method = 'StopService' if self.ServiceSignal.stop else 'DisableService'
-                final_state = self.ServiceState.Stopped
-            case self.ServiceSignal.pause:
-                control_method = 'PauseService'
-                final_state = self.ServiceState.Paused
-            case _:
-                raise ServerObjectManagementError(ServerObjectManagementError.BAD_OBJECT_SIGNAL, signal=signal.name)
-
-        control_method = final_state = ''
+        try:
+            control_method, final_state = _SERVICE_SIGNAL_CONTROLS[signal]
+        except KeyError as err:
+            raise ServerObjectManagementError(ServerObjectManagementError.BAD_OBJECT_SIGNAL, signal=signal.name) from err
+
         if not ignore_state:
-            wait_for = self.ServiceState.Running
-            match self.state:
-                case self.ServiceState.StartPending | self.ServiceState.Running | self.ServiceState.ContinuePending:
-                    wait_for = self.ServiceState.Running
-                    if signal in (self.ServiceSignal.enable, self.ServiceSignal.start, self.ServiceSignal.resume):
-                        control_method = ''
-                case self.ServiceState.StopPending | self.ServiceState.Stopped:
-                    wait_for = self.ServiceState.Stopped
-                    match signal:
-                        case self.ServiceSignal.disable, self.ServiceSignal.stop:
-                            control_method = ''
-                        case self.ServiceSignal.resume, self.ServiceSignal.restart:
-                            control_method = 'StartService'
-                        case self.ServiceSignal.pause:
-                            raise ServerObjectManagementError(ServerObjectManagementError.BAD_TRANSITION, from_state='stopped', to_state='paused')
-                case self.ServiceState.PausePending | self.ServiceState.Paused:
-                    wait_for = self.ServiceState.Paused
-                    if signal == self.ServiceSignal.start:
-                        control_method = 'ResumeService'
-                case _:
-                    raise ServerObjectManagementError(ServerObjectManagementError.BAD_OBJECT_STATE, state=self.state)
-            wait_length = 0
-            while self.state != wait_for:
-                sleep(_STATUS_CHECK_INTERVAL)
-                wait_length += _STATUS_CHECK_INTERVAL
-                if timeout and (wait_length > timeout):
-                    raise ServerObjectManagementError(ServerObjectManagementError.STATUS_CHECK_TIMEOUT, type='service', state=wait_for.name)
+            if (wait_for := _SERVICE_SETTLED_STATES.get(state := self.state)) is None:
+                raise ServerObjectManagementError(ServerObjectManagementError.BAD_OBJECT_STATE, state=state)
+            if (wait_for, signal) in _SERVICE_INVALID_TRANSITIONS:
+                raise ServerObjectManagementError(ServerObjectManagementError.BAD_TRANSITION, from_state=wait_for.name.lower(), to_state=final_state.name.lower())
+            control_method = _SERVICE_TRANSITION_CONTROLS.get((wait_for, signal), control_method)
+            if not _wait_for(lambda: self.state == wait_for, timeout):
+                raise ServerObjectManagementError(ServerObjectManagementError.STATUS_CHECK_TIMEOUT, type='service', state=wait_for.name)
 
         if control_method:
-            if WIN32 and control_method == 'RestartService':
-                self.manage(self.ServiceSignal.stop, wait=wait, ignore_state=ignore_state)
-                self.manage(self.ServiceSignal.start, wait=wait, ignore_state=ignore_state)
-            else:
-                getattr(self, control_method)()
-                sleep(_STATUS_CHECK_INTERVAL)
-        wait_length = 0
-        while wait and (self.state != final_state):
-            sleep(_STATUS_CHECK_INTERVAL)
-            wait_length += _STATUS_CHECK_INTERVAL
-            if timeout and (wait_length > timeout):
-                raise ServerObjectManagementError(ServerObjectManagementError.STATUS_CHECK_TIMEOUT, type='service', state=final_state.name)
+            if WIN32 and control_method == 'RestartService':  # Windows services have no restart control
+                self.StopService()
+                self.invalidate()
+                if not _wait_for(lambda: self.state == ServiceState.Stopped, timeout):
+                    raise ServerObjectManagementError(ServerObjectManagementError.STATUS_CHECK_TIMEOUT, type='service', state=ServiceState.Stopped.name)
+                control_method = 'StartService'
+            getattr(self, control_method)()
+            self.invalidate()  # The state must be read again after the control is sent
+        if wait and not _wait_for(lambda: self.state == final_state, timeout):
+            raise ServerObjectManagementError(ServerObjectManagementError.STATUS_CHECK_TIMEOUT, type='service', state=final_state.name)
 
 
 class Process(ManagementObject):
     """Class to create a universal abstract interface for an OS process."""
 
+    def _has_exited(self) -> bool:
+        """Refresh the process and determine if it has exited.
+
+        Returns:
+            True if the process no longer exists, False otherwise.
+        """
+        self.refresh()
+        return not self.object_ref
+
     def manage(self, signal: ProcessSignal, /, *, wait: bool = True, timeout: bool = False) -> None:
         """Manage the process.
 
@@ -1060,24 +1312,11 @@ class Process(ManagementObject):
             ServerObjectManagementError.BAD_OBJECT_SIGNAL: If the requested action is invalid.
             ServerObjectManagementError.STATUS_CHECK_TIMEOUT: If wait is True and timeout is not False and the object has not reached the required state.
         """
-        control_method = ''
-        match signal:
-            case self.ProcessSignal.stop:
-                control_method = 'Terminate'
-            case self.ProcessSignal.kill:
-                control_method = 'Terminate' if WIN32 else 'Kill'
-            case _:
-                raise ServerObjectManagementError(ServerObjectManagementError.BAD_OBJECT_SIGNAL, signal=signal.name)
-
-        if control_method:
-            getattr(self, control_method)()
-        wait_length = 0
-        while wait and self.object_ref:
-            sleep(_STATUS_CHECK_INTERVAL)
-            self.refresh()
-            wait_length += _STATUS_CHECK_INTERVAL
-            if timeout and (wait_length > timeout):
-                raise ServerObjectManagementError(ServerObjectManagementError.STATUS_CHECK_TIMEOUT, type='process', state=signal.name)
+        if not (control_method := _PROCESS_SIGNAL_METHODS.get(signal)):
+            raise ServerObjectManagementError(ServerObjectManagementError.BAD_OBJECT_SIGNAL, signal=signal.name)
+        getattr(self, control_method)()
+        if wait and not _wait_for(self._has_exited, timeout):
+            raise ServerObjectManagementError(ServerObjectManagementError.STATUS_CHECK_TIMEOUT, type='process', state=signal.name)
 
 
 class ScheduledTask(ManagementObject):  # pylint: disable=too-few-public-methods
@@ -1090,6 +1329,18 @@ class ScheduledTask(ManagementObject):  # pylint: disable=too-few-public-methods
     TASK_HOME = Path(environ['SystemRoot'], 'system32/Tasks') if WIN32 else Path('/opt/cronjobs')
     TASK_NAMESPACE = 'http://schemas.microsoft.com/windows/2004/02/mit/task'
 
+    def refresh_all(self) -> None:
+        """Discard the information queried for all the scheduled tasks on the server of this task.
+
+        Returns:
+            Nothing.
+        """
+        _TASK_SNAPSHOTS.pop((self.manager.computer, self.manager.auth), None)
+        if isinstance(self.object_ref, Win32_ScheduledTask):
+            self.object_ref._task_info = None  # pylint: disable=protected-access
+
+
+_OBJECT_CLASSES: Dict[str, Type] = {c.__name__: c for c in (LinuxProcess, LinuxScheduledTask, LinuxService, Process, ScheduledTask, Service, Win32_ScheduledTask)}
 
 if sys.platform == 'win32':
     class COMObject:
@@ -1109,6 +1360,7 @@ if sys.platform == 'win32':
                 ServerObjectManagementError.REMOTE_CONNECTION_ERROR: If there was a failure making a connection to the COM object.
             """
             self._hostname = hostname
+            (CDispatch, DispatchEx, com_error) = _import_com()
             try:
                 if isinstance(ref, CDispatch):
                     self._connection = ref
@@ -1159,6 +1411,70 @@ def get_server_object(server: ServerType, /) -> Server:
     return Server(*(server.split('.', 1)))
 
 
+def refresh_local_fqdn() -> None:
+    """Re-read the name of the local host for long-running processes which may see it change.
+
+    Only Server objects created after the refresh use the new name.
+
+    Returns:
+        Nothing.
+    """
+    global _LOCAL_DOMAIN, _LOCAL_FQDN, _LOCAL_HOSTNAME  # pylint: disable=global-statement
+    _LOCAL_FQDN = getfqdn().lower()
+    _LOCAL_DOMAIN = _LOCAL_FQDN.partition('.')[2]
+    _LOCAL_HOSTNAME = node().split('.')[0].lower()
+
+
+def _numeric_host(hostname: str, /) -> str:
+    """Recognize a host name which is already an IP address so it does not need to be resolved.
+
+    Args:
+        hostname: The host name.
+
+    Returns:
+        The IP address, empty if the host name is not an IP address.
+    """
+    try:
+        return str(ip_address(hostname))
+    except ValueError:
+        return ''
+
+
+def _resolve_host(fqdn: str, /) -> str:
+    """Resolve a host name to an IP address reusing recent results.
+
+    Args:
+        fqdn: The fully-qualified domain name to resolve.
+
+    Returns:
+        The IP address.
+
+    Raises:
+        gaierror: If the name cannot be resolved.
+    """
+    if (cached := _HOST_CACHE.get(fqdn)) and ((monotonic() - cached[0]) <= _HOST_CACHE_TTL):
+        return cached[1]
+    ip = gethostbyname(fqdn)
+    _HOST_CACHE.pop(fqdn, None)
+    _HOST_CACHE[fqdn] = (monotonic(), ip)
+    if len(_HOST_CACHE) > _HOST_CACHE_SIZE:
+        del _HOST_CACHE[next(iter(_HOST_CACHE))]
+    return ip
+
+
+@lru_cache(maxsize=None)
+def _find_tool(tool: str, /) -> str:
+    """Find the full path of a local command-line tool once so each run does not search the PATH.
+
+    Args:
+        tool: The name of the tool.
+
+    Returns:
+        The full path of the tool, the name of the tool if it is not found on the PATH.
+    """
+    return which(tool) or tool
+
+
 def _run_task_scheduler(*cmd_args, **sys_cmd_args) -> CommandResult:
     """Interface to run the standard Windows schtasks command-line tool.
 
@@ -1169,6 +1485,343 @@ def _run_task_scheduler(*cmd_args, **sys_cmd_args) -> CommandResult:
     Returns:
         The result of the syscmd call to schtasks.
     """
-    return syscmd('schtasks.exe', *cmd_args, **sys_cmd_args)
+    return syscmd(_find_tool('schtasks.exe'), *cmd_args, **sys_cmd_args)
+
+
+def _scheduled_task_snapshot(computer: str, auth: ServerAuthType, /) -> Dict[str, Dict[str, str]]:
+    """Get the information for all the scheduled tasks on a server reusing a recent query.
+
+    Args:
+        computer: The remote computer, empty for the local host.
+        auth: A (username, password) tuple for remote server access.
+
+    Returns:
+        The task information keyed by task name.
+    """
+    if (cached := _TASK_SNAPSHOTS.get((computer, auth))) and ((monotonic() - cached[0]) <= _STATUS_CACHE_TTL):
+        return cached[1]
+    return dict(_stream_scheduled_tasks(computer, auth))
+
+
+def _stream_scheduled_tasks(computer: str, auth: ServerAuthType, /) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """Query the information for all the scheduled tasks on a server and generate it one task at a time.
+
+    Once all the tasks have been read they are kept as the snapshot used by _scheduled_task_snapshot.
+
+    Args:
+        computer: The remote computer, empty for the local host.
+        auth: A (username, password) tuple for remote server access.
+
+    Yields:
+        A (task name, task information) tuple for each scheduled task.
+    """
+    cmd_args = ['/Query', '/V', '/FO', 'CSV']
+    if computer:
+        cmd_args += ['/S', computer]
+    if isinstance(auth, tuple):
+        cmd_args += ('/U', auth[0], '/P', auth[1])
+    snapshot: Dict[str, Dict[str, str]] = {}
+    for task_info in DictReader(_stream_task_scheduler(*cmd_args)):
+        if ((task := task_info['TaskName']) != 'TaskName') and (task not in snapshot):  # A task is listed once for each trigger
+            snapshot[task] = task_info
+            yield (task, task_info)
+    _TASK_SNAPSHOTS[(computer, auth)] = (monotonic(), snapshot)
+
+
+def _acquire_wmi(computer: str, auth: ServerAuthType, /) -> 'WMI':
+    """Get a WMI connection from the pool for the current thread, connecting if there is none.
+
+    Args:
+        computer: The remote computer, empty for the local host.
+        auth: A (username, password) tuple for remote server access.
+
+    Returns:
+        The WMI connection.
+    """
+    if (pool := getattr(_WMI_POOL, 'connections', None)) is None:
+        pool = _WMI_POOL.connections = OrderedDict()
+    if (connection := pool.get(key := (computer, auth))) is not None:
+        pool.move_to_end(key)
+        return connection
+    manager_args = {'computer': computer} if computer else {}
+    if isinstance(auth, tuple):
+        manager_args['user'] = auth[0]
+        manager_args['password'] = auth[1]
+    connection = pool[key] = _import_wmi()[0](**manager_args)
+    if len(pool) > _WMI_POOL_SIZE:
+        pool.popitem(last=False)
+    return connection
+
+
+def _release_wmi(computer: str, auth: ServerAuthType, /) -> None:
+    """Drop a WMI connection from the pool for the current thread after it has failed.
+
+    Args:
+        computer: The remote computer, empty for the local host.
+        auth: A (username, password) tuple for remote server access.
+
+    Returns:
+        Nothing.
+    """
+    if (pool := getattr(_WMI_POOL, 'connections', None)) is not None:
+        pool.pop((computer, auth), None)
+
+
+def _read_proc_attr(proc_dir: str, attr: str, /) -> Any:
+    """Read a single process attribute directly from the /proc directory of the process.
+
+    The values match the corresponding psutil.Process methods.
+
+    Args:
+        proc_dir: The /proc directory of the process.
+        attr: The psutil process attribute to read: cmdline, exe or name.
+
+    Returns:
+        The attribute value, None if the value could not be read.
+    """
+    match attr:
+        case 'cmdline':
+            with open(f'{proc_dir}/cmdline', 'rb') as cmdline_file:
+                if not (cmdline := fsdecode(cmdline_file.read())):
+                    return []
+            separator = '\0' if cmdline.endswith('\0') else ' '
+            return cmdline.rstrip(separator).split(separator)
+        case 'exe':
+            try:
+                return readlink(f'{proc_dir}/exe')
+            except FileNotFoundError:
+                return ''  # Kernel threads have no executable
+            except PermissionError:
+                return None
+        case 'name':
+            with open(f'{proc_dir}/comm', 'rb') as comm_file:
+                name = fsdecode(comm_file.read()).rstrip('\n')
+            if (len(name) >= 15) and (cmdline := _read_proc_attr(proc_dir, 'cmdline')) and (full_name := basename(cmdline[0])).startswith(name):
+                name = full_name  # The kernel truncates comm to 15 characters
+            return name
+    raise ValueError(attr)
+
+
+def _scan_processes(attr: str, /) -> Iterator[Tuple[int, Any]]:
+    """Generate the process IDs with a single attribute of each process.
+
+    On Linux /proc is read directly, which avoids the per-process overhead of psutil.process_iter.
+
+    Args:
+        attr: The psutil process attribute to read: cmdline, exe or name.
+
+    Yields:
+        A (process ID, attribute value) tuple for each process.
+    """
+    if not sys.platform.startswith('linux'):
+        for process in _import_psutil().process_iter(attrs=('pid', attr)):
+            yield (process.pid, process.info[attr])
+        return
+    with scandir('/proc') as proc_entries:
+        for entry in proc_entries:
+            if entry.name.isdigit():
+                try:
+                    yield (int(entry.name), _read_proc_attr(entry.path, attr))
+                except (FileNotFoundError, ProcessLookupError):
+                    pass  # The process exited during the scan
+
+
+def _match_processes(attr: str, value: str, /) -> List[int]:
+    """Find the processes with a single attribute value in one scan of the current processes.
+
+    Args:
+        attr: The psutil process attribute to match: cmdline, exe or name.
+        value: The value to match, with the command line joined by spaces.
+
+    Returns:
+        The process IDs of the matching processes.
+    """
+    if attr == 'cmdline':
+        return [pid for (pid, cmdline) in _scan_processes(attr) if ' '.join(cmdline or []) == value]
+    return [pid for (pid, process_value) in _scan_processes(attr) if process_value == value]
+
 
-# cSpell:ignore cmdline sbin wsahost psutil syscmd iispy platarch serverpath schtasks
+def _add_task_working_directory(task_file: Path, working_dir: PathName, /) -> None:
+    """Add a working directory to the Exec action of a scheduled task definition.
+
+    The element is spliced into the text so the file keeps its UTF-16 encoding and layout without being parsed and re-serialized.
+
+    Args:
+        task_file: The task definition file.
+        working_dir: The working directory for the task.
+
+    Returns:
+        Nothing.
+    """
+    with open(task_file, encoding='utf-16', newline='') as task_stream:
+        task_xml = task_stream.read()
+    if (exec_end := task_xml.rfind('</Exec>')) == -1:
+        return
+    newline = '\r\n' if ('\r\n' in task_xml) else '\n'
+    indent = task_xml[task_xml.rfind('\n', 0, exec_end) + 1:exec_end]
+    with open(task_file, 'w', encoding='utf-16', newline='') as task_stream:
+        task_stream.write(f'{task_xml[:exec_end]}  <WorkingDirectory>{xml_escape(str(working_dir))}</WorkingDirectory>{newline}{indent}{task_xml[exec_end:]}')
+
+
+def _import_com() -> Tuple[Type, Callable, Type[Exception]]:
+    """Import the COM client interface on first use since it loads pythoncom and the COM type libraries.
+
+    Returns:
+        The COM dispatch class, the COM dispatch factory and the COM exception class.
+
+    Raises:
+        ImportError: If this is not a Windows platform.
+    """
+    if sys.platform == 'win32':
+        from pywintypes import com_error  # pylint: disable=no-name-in-module,import-error,import-outside-toplevel
+        from win32com.client import CDispatch, DispatchEx  # pylint: disable=import-error,import-outside-toplevel
+        return (CDispatch, DispatchEx, com_error)
+    raise ImportError('COM is only available on Windows')
+
+
+@lru_cache(maxsize=None)
+def _import_psutil() -> ModuleType:
+    """Import psutil on first use so that importing this module does not load it.
+
+    Returns:
+        The psutil module.
+    """
+    import psutil  # pylint: disable=import-outside-toplevel
+    return psutil
+
+
+def _import_wmi() -> Tuple[Type['WMI'], Type['x_wmi']]:
+    """Import the WMI interface on first use since it loads pythoncom and the COM type libraries.
+
+    Returns:
+        The WMI connection class and the WMI exception class.
+    """
+    if sys.platform == 'win32':
+        from wmi import WMI as wmi_class, x_wmi as wmi_error  # pylint: disable=import-error,import-outside-toplevel
+        return (wmi_class, wmi_error)
+    return (WMI, x_wmi)
+
+
+def _stream_task_scheduler(*cmd_args) -> Iterator[str]:
+    """Run the standard Windows schtasks command-line tool and generate its output lines as they are written.
+
+    The errors are collected in a temporary file rather than a pipe so that schtasks cannot block on a full error pipe
+    while the output is still being read, and so that they are not mixed into the CSV output.
+
+    Args:
+        *cmd_args: The arguments to pass to schtasks.
+
+    Yields:
+        The output lines of schtasks.
+
+    Raises:
+        CMDError.CMD_ERROR: If schtasks returns a non-zero exit code.
+    """
+    with TemporaryFile('w+') as err_file, Popen(cmd_spec := [_find_tool('schtasks.exe'), *cmd_args], universal_newlines=True, stdout=PIPE, stderr=err_file) as proc:
+        yield from cast(IO, proc.stdout)
+        if returncode := proc.wait():
+            err_file.seek(0)
+            err_lines = err_file.readlines()
+            raise CMDError(CMDError.CMD_ERROR, cmd=' '.join(f'"{c}"' for c in cmd_spec), returncode=returncode, err_lines=err_lines, outlines=[])
+
+
+def _linux_processes(process_ids: List[int], /) -> List['LinuxProcess']:
+    """Get the Linux processes for a list of process IDs skipping any which have exited.
+
+    Args:
+        process_ids: The process IDs.
+
+    Returns:
+        The list of Linux processes.
+    """
+    processes = []
+    for process_id in process_ids:
+        try:
+            processes.append(LinuxProcess(process_id))
+        except _import_psutil().NoSuchProcess:
+            pass
+    return processes
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 0, /, *, initial: float = 0.01, cap: float = _STATUS_CHECK_INTERVAL) -> bool:
+    """Poll until a condition is met, starting with short waits and doubling them up to a limit.
+
+    Args:
+        condition: The function which returns True when the wait is over.
+        timeout (optional, default=0): The number of seconds after which to stop waiting, indefinitely if 0.
+        initial (optional, default=0.01): The number of seconds of the first wait.
+        cap (optional, default=_STATUS_CHECK_INTERVAL): The maximum number of seconds of any one wait.
+
+    Returns:
+        True if the condition was met, False if the timeout expired first.
+    """
+    deadline = (monotonic() + timeout) if timeout else 0
+    delay = initial
+    while not condition():
+        if deadline and ((remaining := deadline - monotonic()) <= 0):
+            return False
+        sleep(min(delay, remaining) if deadline else delay)
+        delay = min(delay * 2, cap)
+    return True
+
+
+def _wql_select(class_name: str, filters: Dict[str, Any], /) -> str:
+    """Build a WQL query so that WMI filters the objects on the server.
+
+    The WMI query method enumerates the results with the return-immediately and forward-only flags
+    so the provider does not build and cache the full result set before returning.
+
+    Args:
+        class_name: The WMI class to query.
+        filters: A dictionary of property values the objects must match.
+
+    Returns:
+        The WQL query.
+
+    Raises:
+        ValueError: If a filter value contains both single and double quotes.
+    """
+    return _wql_template(class_name, tuple(filters)).format(*map(_wql_literal, filters.values()))
+
+
+@lru_cache(maxsize=128)
+def _wql_template(class_name: str, filter_keys: Tuple[str, ...], /) -> str:
+    """Build the WQL query template for a class and set of filter keys.
+
+    Args:
+        class_name: The WMI class to query.
+        filter_keys: The properties to filter on in order.
+
+    Returns:
+        The WQL query with a positional format field for each filter value.
+    """
+    wql = f'SELECT * FROM {class_name}'
+    if filter_keys:
+        wql += ' WHERE ' + ' AND '.join(f'{k} = {{{i}}}' for (i, k) in enumerate(filter_keys))
+    return wql
+
+
+def _wql_literal(value: Any, /) -> str:
+    """Format a value as a WQL literal for the WMI query method.
+
+    The WMI query method doubles every backslash in the query itself, so backslashes are left as they are
+    and quotes are avoided by choosing the delimiter, as the WMI class query does, instead of being escaped.
+
+    Args:
+        value: The value to format.
+
+    Returns:
+        The value unquoted if it is a number, otherwise the value in single quotes, or in double quotes if it contains a single quote.
+
+    Raises:
+        ValueError: If the value contains both single and double quotes.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    if "'" not in (value := str(value)):
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    raise ValueError(f'A WQL filter value cannot contain both single and double quotes: {value}')
+
+# cSpell:ignore cmdline sbin wql wsahost psutil syscmd iispy platarch serverpath schtasks
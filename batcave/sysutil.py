@@ -381,7 +381,7 @@ def _rmtree_onerror(caller: Callable, path_str: PathName, excinfo: Any) -> None:
 
 
 def _construct_remote_driver(remote: Optional[bool | str] = False, remote_is_windows: Optional[bool] = None, copy_for_remote: bool = False,  # pylint: disable=too-many-locals,too-many-branches
-                             remote_auth: Optional[ServerAuthType] = None, remote_powershell: bool = False) -> List[str]:
+                             remote_auth: Optional[ServerAuthType] = None, remote_powershell: bool = False, remote_share: bool = False) -> List[str]:
     """Construct the remote command execution prefix for syscmd.
 
     Args:
@@ -390,6 +390,7 @@ def _construct_remote_driver(remote: Optional[bool | str] = False, remote_is_win
         copy_for_remote=False
         remote_auth=False
         remote_powershell=False
+        remote_share=False: If True, share one ssh or plink connection to the remote host between commands.
 
     Returns:
         The list which specifies the prefix for executing a remote command.
@@ -418,6 +419,8 @@ def _construct_remote_driver(remote: Optional[bool | str] = False, remote_is_win
             if copy_for_remote:
                 raise CMDError(CMDError.INVALID_OPERATION, func='copy_for_remote', context='Linux')
             remote_driver = ['plink', '-batch', '-v']
+            if remote_share:
+                remote_driver.append('-share')
             if isinstance(remote_auth, tuple):
                 remote_driver += ['-l', remote_auth[0], '-pw', remote_auth[1]]
             elif remote_auth:
@@ -427,6 +430,8 @@ def _construct_remote_driver(remote: Optional[bool | str] = False, remote_is_win
         if copy_for_remote:
             raise CMDError(CMDError.INVALID_OPERATION, func='copy_for_remote', context='Linux')
         remote_driver = ['ssh', '-t', '-t']
+        if remote_share:  # Keep the connection open until it has been idle for a minute
+            remote_driver += ['-o', 'ControlMaster=auto', '-o', f'ControlPath={_ssh_control_dir() / "%C"}', '-o', 'ControlPersist=60']
         if isinstance(remote_auth, tuple):
             remote_driver += ['-J', f'{remote_auth[0]}@{remote_auth[1]}']
         elif remote_auth:
@@ -435,11 +440,26 @@ def _construct_remote_driver(remote: Optional[bool | str] = False, remote_is_win
     return remote_driver
 
 
+def _ssh_control_dir() -> Path:
+    """Get the directory for the shared ssh connection sockets, creating it if needed.
+
+    The directory is private to the current user so that no other user can reach an authenticated connection through a socket.
+
+    Returns:
+        The socket directory.
+    """
+    control_dir = Path.home() / '.ssh' / 'batcave'
+    control_dir.parent.mkdir(mode=S_IRWXU, exist_ok=True)
+    control_dir.mkdir(mode=S_IRWXU, exist_ok=True)
+    control_dir.chmod(S_IRWXU)
+    return control_dir
+
+
 def syscmd(command: PathName, /, *cmd_args, input_lines: Optional[Iterable] = None,  # pylint: disable=too-many-locals,too-many-branches,too-many-statements,too-many-arguments
            show_stdout: bool = False, ignore_stderr: bool = False, append_stderr: bool = False, fail_on_error: bool = True,
            show_cmd: bool = False, use_shell: bool = False, flatten_output: bool = False,
            remote: Optional[bool | str] = False, remote_is_windows: Optional[bool] = None, copy_for_remote: bool = False,
-           remote_auth: Optional[ServerAuthType] = None, remote_powershell: bool = False) -> CommandResult:
+           remote_auth: Optional[ServerAuthType] = None, remote_powershell: bool = False, remote_share: bool = False) -> CommandResult:
     """Wrapper to provide a better interface to subprocess.Popen().
 
     Args:
@@ -458,6 +478,7 @@ def syscmd(command: PathName, /, *cmd_args, input_lines: Optional[Iterable] = No
         copy_for_remote=False
         remote_auth=False
         remote_powershell=False
+        remote_share=False
 
     Returns:
         The string (or string-list) output of the command.
@@ -469,12 +490,12 @@ def syscmd(command: PathName, /, *cmd_args, input_lines: Optional[Iterable] = No
     """
     cmd_spec = [str(command)] + [str(c) for c in cmd_args]
     remote_driver: List[str] = []
-    if (not remote) and (remote_auth or copy_for_remote or remote_powershell or remote_is_windows):
+    if (not remote) and any((remote_auth, copy_for_remote, remote_powershell, remote_is_windows, remote_share)):
         raise CMDError(CMDError.INVALID_OPERATION, func='remote options', context='local servers')
     if remote and WIN32 and remote_is_windows and not remote_powershell:
         ignore_stderr = True  # psexec puts status info on stderr
     if remote:
-        remote_driver = _construct_remote_driver(remote, remote_is_windows, copy_for_remote, remote_auth, remote_powershell)
+        remote_driver = _construct_remote_driver(remote, remote_is_windows, copy_for_remote, remote_auth, remote_powershell, remote_share)
         remote_cmd = cmd_spec
         if use_shell and remote_is_windows:
             remote_cmd = ['cmd', '/c'] + cmd_spec
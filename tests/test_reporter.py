@@ -0,0 +1,128 @@
+"""Unit tests for the reporter module."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring,invalid-name
+# flake8: noqa
+
+from io import StringIO
+from unittest import main, TestCase
+
+from batcave.reporter import Line, Link, LinkList, Report, ReportObject, Section, SimpleAttribute, Table
+
+TEXT_RULE = ('-' * 79) + '\n'
+
+
+class TestSimpleAttribute(TestCase):
+    def test_simple_attribute_1_valid(self):
+        attr = SimpleAttribute('html', 'text')
+        self.assertEqual(attr.count, 2)
+        attr.value = 'text'
+        self.assertEqual(attr.value, 'text')
+        self.assertRaises(ValueError, setattr, attr, 'value', 'bad')
+
+    def test_simple_attribute_2_clone(self):
+        (attr := SimpleAttribute('html', 'text')).value = 'text'
+        the_clone = attr.clone()
+        self.assertEqual(the_clone.value, 'text')
+        self.assertEqual(the_clone.count, 2)
+
+
+class TestReport(TestCase):
+    def test_report_1_text(self):
+        report = Report(header='HEADER', footer='FOOTER', output='text')
+        report.add_line(Line('a line'))
+        section = Section(header='Section Header', footer='Section Footer')
+        report.add_section(section)
+        section.add_line(Line('in section'))
+        self.assertEqual(str(report), '\n' + TEXT_RULE + 'HEADER\n' + TEXT_RULE + 'a line\n'
+                         + 'Section Header\nin section\nSection Footer\n' + ('=' * 79) + '\n'
+                         + TEXT_RULE + 'FOOTER\n' + TEXT_RULE + '\n')
+
+    def test_report_2_html(self):
+        report = Report(header='HEADER')
+        section = Section(header='Section Header')
+        report.add_section(section)
+        section.add_line(Line('in section'))
+        self.assertEqual(str(report), '<html><meta http-equiv="Content-Type" content="text/html;charset=utf-8"><body><center>'
+                         '<h1>HEADER<br></h1><h2>Section Header<br></h2>in section<br></center></body></html>')
+
+    def test_report_3_render_twice(self):
+        report = Report(header='HEADER', output='text')
+        report.add_line(Line('a line'))
+        self.assertEqual(str(report), str(report))
+
+    def test_report_4_attribute_change(self):
+        report = Report()
+        report.add_line(line := Line('a line'))
+        self.assertEqual(str(line), 'a line<br>')
+        report.output = 'text'
+        self.assertEqual(str(line), 'a line\n')
+        section = Section(output='text', lin_trm={'text': ';\n', 'html': ''})
+        section.add_line(line)
+        self.assertEqual(str(line), 'a line;\n')
+
+    def test_report_5_write_to(self):
+        report = Report(header='HEADER', output='text')
+        report.add_line(Line('a line'))
+        report.add_table(Table([['1', '2']]))
+        report.write_to(stream := StringIO())
+        self.assertEqual(stream.getvalue(), str(report))
+
+    def test_report_6_depth(self):
+        section = Section()
+        section.add_line(line := Line('a line'))
+        self.assertEqual(line.depth, 2)
+        Report().add_section(section)
+        self.assertEqual(line.depth, 3)
+
+    def test_report_7_str_override(self):
+        class CustomLine(Line):
+            def __str__(self):
+                return 'CUSTOM'
+
+        class CustomObject(ReportObject):
+            def __str__(self):
+                return 'OBJECT'
+
+        report = Report(output='text')
+        report.add_line(CustomLine('x'))
+        section = Section()
+        section.add_member(CustomObject())
+        report.add_section(section)
+        self.assertEqual(str(report), '\nCUSTOMOBJECT' + ('=' * 79) + '\n\n')
+        report.write_to(stream := StringIO())
+        self.assertEqual(stream.getvalue(), str(report))
+
+
+class TestTable(TestCase):
+    def test_table_1_text(self):
+        report = Report(output='text')
+        report.add_table(Table([['11', '12'], ['2100', '22'], ['a', 'bbbbbbb', 'ccc']], header='Table Header'))
+        self.assertEqual(str(report), '\nTable Header\n|  11  |   12    |\n| 2100 |   22    |\n|  a   | bbbbbbb | ccc |\n\n')
+
+    def test_table_2_html(self):
+        report = Report()
+        report.add_table(Table([['1', '2']]))
+        self.assertIn('<table border="1"><tr><td>1</td><td>2</td></tr></table><br>', str(report))
+
+
+class TestLink(TestCase):
+    def test_link_1_html(self):
+        report = Report()
+        report.register_link(link := Link('text', 'http://url'))
+        self.assertEqual(str(link), '<a href="http://url">text</a>')
+
+    def test_link_2_text(self):
+        report = Report(output='text')
+        report.register_link(link := Link('text', 'http://url'))
+        self.assertEqual(str(link), 'text')
+
+    def test_link_list_1_sorted(self):
+        report = Report(output='text')
+        report.register_link(links := LinkList({'link2': 'http://link2', 'link1': 'http://link1'}))
+        self.assertEqual(str(links), 'link1, link2')
+
+
+if __name__ == '__main__':
+    main()
+
+# cSpell:ignore batcave
@@ -0,0 +1,102 @@
+"""Unit tests for the servermgr module."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring,invalid-name
+# flake8: noqa
+
+from os import getpid
+from subprocess import Popen
+from sys import platform
+from unittest import main, skipIf, TestCase
+from unittest.mock import patch
+
+from psutil import Process as _Process
+
+from batcave.servermgr import OSManager, Server, ServerObjectManagementError, _wait_for, _wql_select
+
+
+@skipIf(platform == 'win32', 'Linux process management only')
+class TestOSManager(TestCase):
+    def test_LinuxProcess_1_by_id(self):
+        self.assertEqual([p.ProcessId for p in OSManager().LinuxProcess(ProcessId=getpid())], [getpid()])
+
+    def test_LinuxProcess_2_by_name(self):
+        manager = OSManager()
+        self.assertIn(getpid(), [p.ProcessId for p in manager.LinuxProcess(Name=_Process(getpid()).name())])
+        self.assertEqual(manager.LinuxProcess(Name='no-such-process-name'), [])
+
+    def test_LinuxProcess_3_bad_filter(self):
+        self.assertRaises(ServerObjectManagementError, OSManager().LinuxProcess, Name='a', ExecutablePath='b')
+
+    def test_LinuxProcess_4_new_process(self):
+        manager = OSManager()
+        manager.LinuxProcess(Name='sleep')
+        with Popen(['sleep', '10']) as new_process:
+            try:
+                self.assertTrue(_wait_for(lambda: _Process(new_process.pid).name() == 'sleep', 5))
+                self.assertIn(new_process.pid, [p.ProcessId for p in manager.LinuxProcess(Name='sleep')])
+            finally:
+                new_process.kill()
+
+    def test_LinuxProcess_5_properties(self):
+        (process,) = OSManager().LinuxProcess(ProcessId=getpid())
+        expected = _Process(getpid())
+        self.assertEqual((process.CommandLine, process.ExecutablePath, process.Name), (expected.cmdline(), expected.exe(), expected.name()))
+        process.refresh()
+        self.assertEqual(process.Name, expected.name())
+
+
+class TestServer(TestCase):
+    def test_Server_1_local(self):
+        server = Server()
+        self.assertTrue(server.is_local)
+        self.assertEqual(server.fqdn, f'{server.hostname}.{server.domain}' if server.domain else server.hostname)
+
+    def test_Server_2_remote(self):
+        server = Server('RemoteHost', 'Example.com', ip='192.0.2.1')
+        self.assertFalse(server.is_local)
+        self.assertEqual(server.fqdn, 'remotehost.example.com')
+
+    def test_Server_3_empty_status_bundle(self):
+        self.assertEqual(Server().get_status_bundle(), ([], []))
+
+    def test_Server_4_numeric_host(self):
+        self.assertEqual(Server('192.0.2.7').ip, '192.0.2.7')
+
+    def test_Server_5_lazy_ip(self):
+        server = Server('no-such-host', 'invalid')
+        self.assertRaises(ServerObjectManagementError, getattr, server, 'ip')
+
+    @skipIf(platform == 'win32', 'Windows lookups are repeated on the calling thread')
+    def test_Server_6_status_bundle_order(self):
+        services = [f'service{i}' for i in range(40)]
+        with patch.object(Server, 'get_service', lambda s, n: ('service', n)), patch.object(Server, 'get_scheduled_task', lambda s, n: ('task', n)):
+            self.assertEqual(Server().get_status_bundle(services=services, tasks=['task']), ([('service', s) for s in services], [('task', 'task')]))
+
+
+class TestWaitFor(TestCase):
+    def test_wait_for_1_met(self):
+        checks = iter((False, False, True))
+        self.assertTrue(_wait_for(lambda: next(checks), initial=0.001))
+
+    def test_wait_for_2_timeout(self):
+        self.assertFalse(_wait_for(lambda: False, 0.05, initial=0.01))
+
+
+class TestWQL(TestCase):
+    def test_wql_select_1_no_filter(self):
+        self.assertEqual(_wql_select('Win32_Service', {}), 'SELECT * FROM Win32_Service')
+
+    def test_wql_select_2_literals(self):
+        wql = _wql_select('Win32_Process', {'Name': "it's {0}", 'ExecutablePath': r'C:\bin', 'ProcessId': 12})
+        self.assertEqual(wql, r"""SELECT * FROM Win32_Process WHERE Name = "it's {0}" AND ExecutablePath = 'C:\bin' AND ProcessId = 12""")
+        # The WMI query method doubles the backslashes before sending the query
+        self.assertEqual(wql.replace('\\', '\\\\'), r"""SELECT * FROM Win32_Process WHERE Name = "it's {0}" AND ExecutablePath = 'C:\\bin' AND ProcessId = 12""")
+
+    def test_wql_select_3_both_quotes(self):
+        self.assertRaises(ValueError, _wql_select, 'Win32_Service', {'Name': 'it\'s "quoted"'})
+
+
+if __name__ == '__main__':
+    main()
+
+# cSpell:ignore batcave psutil servermgr
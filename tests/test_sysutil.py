@@ -5,12 +5,16 @@
 
 from enum import Enum
 from multiprocessing import Process, Queue
-from os import fdopen
+from os import environ, fdopen
 from pathlib import Path
+from shutil import rmtree
+from stat import S_IMODE, S_IRWXU
+from sys import platform
 from tempfile import mkdtemp, mkstemp
-from unittest import main, skip, TestCase
+from unittest import main, skip, skipIf, TestCase
+from unittest.mock import patch
 
-from batcave.sysutil import pushd, popd, CMDError, LockFile, LockError, LockMode
+from batcave.sysutil import pushd, popd, syscmd, CMDError, LockFile, LockError, LockMode, _construct_remote_driver
 
 LockSignal = Enum('LockSignal', ('true', 'false'))
 
@@ -75,6 +79,35 @@ def secondary_lock_process(filename, queue):
         queue.put(LockSignal.false)
 
 
+@skipIf(platform == 'win32', 'ssh remote driver only')
+class TestRemoteDriver(TestCase):
+    def setUp(self):
+        self._home = mkdtemp()
+        self._patch_home = patch.dict(environ, {'HOME': self._home})
+        self._patch_home.start()
+
+    def tearDown(self):
+        self._patch_home.stop()
+        rmtree(self._home)
+
+    def test_remote_driver_1_not_shared(self):
+        self.assertEqual(_construct_remote_driver('host', remote_auth='key'), ['ssh', '-t', '-t', '-i', 'key', 'host'])
+        self.assertFalse(Path(self._home, '.ssh').exists())
+
+    def test_remote_driver_2_shared(self):
+        control_dir = Path(self._home, '.ssh', 'batcave')
+        self.assertEqual(_construct_remote_driver('host', remote_share=True),
+                         ['ssh', '-t', '-t', '-o', 'ControlMaster=auto', '-o', f'ControlPath={control_dir / "%C"}', '-o', 'ControlPersist=60', 'host'])
+        self.assertEqual(S_IMODE(control_dir.stat().st_mode), S_IRWXU)
+
+    def test_remote_driver_3_remote_options_local(self):
+        for option in ('remote_auth', 'copy_for_remote', 'remote_powershell', 'remote_is_windows', 'remote_share'):
+            with self.subTest(option=option):
+                with self.assertRaises(CMDError) as result:
+                    syscmd('true', **{option: True})
+                self.assertEqual(result.exception.code, CMDError.INVALID_OPERATION.code)
+
+
 class TestDirStack(TestCase):
     def setUp(self):
         self._tempdir = Path(mkdtemp()).resolve()